@@ -3,16 +3,19 @@
 """
 
 import time
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.modules.llm import ollamac
 from app.modules.ollama_manager import MANAGER
+from app.modules.logging import TranslationLogger
 from app.services.dictionary_manager import DICTIONARY
 from app.services.translate_service import HISTORY
 from app.api.v1.endpoint import api_router
@@ -25,25 +28,42 @@ logger.setLevel("DEBUG")
 
 logger.debug("디버그 메시지가 보입니다")
 
-# 응답 시간 측정 미들웨어
-class TimingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
+# 응답 시간 측정에서 제외할 경로
+_SKIP_PATHS = frozenset(["/", "/docs", "/redoc", "/openapi.json"])
+
+# 응답 시간 측정 미들웨어 (BaseHTTPMiddleware의 태스크 전환 없이 ASGI로 직접 처리)
+class TimingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in _SKIP_PATHS:
+            return await self.app(scope, receive, send)
+
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                MutableHeaders(scope=message).append("X-Process-Time", f"{process_time:.6f}")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 로거 초기화
     start_logger()
+
+    # 번역 로그 백그라운드 기록 시작
+    TranslationLogger.start()
     
     # 시작 시 경로 설정 및 초기화
-    DICTIONARY.initialize_dictionaries()
+    await DICTIONARY.initialize_dictionaries()
     
-    # 번역 이력 초기화    
-    HISTORY.initialize()
+    # 번역 이력 초기화 (파일 읽기는 별도 스레드에서 실행) 및 백그라운드 기록 시작
+    await asyncio.to_thread(HISTORY.initialize)
+    HISTORY.start()
     
     # 모델 사전 로드
     if settings.PRELOAD_MODEL:
@@ -63,27 +83,45 @@ async def lifespan(app: FastAPI):
     if MANAGER:
         await MANAGER.shutdown()
 
+    # Ollama 클라이언트 연결 종료
+    await ollamac.close()
+
+    # 저장 대기 중인 사전 파일 저장
+    await DICTIONARY.flush()
+
+    # 남은 번역 이력 기록 후 종료
+    await HISTORY.stop()
+
+    # 남은 번역 로그 기록 후 종료
+    await TranslationLogger.stop()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title=settings.APP_NAME,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # 타이밍 미들웨어 추가
 app.add_middleware(TimingMiddleware)
 
-# CORS 미들웨어 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 실제 배포 시에는 허용할 도메인만 지정해야 함
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS 미들웨어 설정 (브라우저에서 호출하는 경우에만 활성화)
+if settings.ENABLE_CORS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ALLOW_ORIGINS,  # 허용할 도메인만 지정
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["*"],
+    )
 
 # API 라우터 등록
 app.include_router(api_router)
-app.include_router(api_router, prefix="/api/v1beta", tags=["v1beta"])
+
+# v1beta 경로는 기본 경로로 리다이렉트 (라우터를 중복 등록하지 않음)
+@app.api_route("/api/v1beta/{path:path}", methods=["GET", "POST"], include_in_schema=False)
+async def v1beta_redirect(path: str, request: Request):
+    return RedirectResponse(url=str(request.url.replace(path=f"/{path}")), status_code=307)
 
 # 기본 엔드포인트
 @app.get("/")
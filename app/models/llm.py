@@ -1,18 +1,25 @@
 from abc import ABC
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
 from app.utils.language_utils import get_language_name
 
+# 허용되는 메시지 역할
+_ALLOWED_ROLES = frozenset(['system', 'user', 'assistant', 'tool', 'function'])
+
 class Message(BaseModel):
-    """채팅 메시지 모델"""
+    """
+    채팅 메시지 모델 (외부 입력 검증용)
+
+    서비스 내부에서 만드는 메시지는 검증 없이 {"role": ..., "content": ...} 딕셔너리로 전달합니다.
+    """
     role: str = Field(..., description="메시지 역할 (예: system, user, assistant)")
     content: str = Field(..., description="메시지 내용")
     
     @field_validator('role')
     def validate_role(cls, v):
-        allowed_roles = ['system', 'user', 'assistant', 'tool', 'function']
-        if v not in allowed_roles:
-            raise ValueError(f"허용되지 않는 역할입니다. 허용 역할: {', '.join(allowed_roles)}")
+        if v not in _ALLOWED_ROLES:
+            raise ValueError(f"허용되지 않는 역할입니다. 허용 역할: {', '.join(sorted(_ALLOWED_ROLES))}")
         return v
 
 class WordMapping(BaseModel):
@@ -25,78 +32,49 @@ class TranslateReseponse(BaseModel):
     translation: str = Field(..., description="번역된 텍스트")
     word_mapping: List[WordMapping] = Field(default_factory=list, description="단어 매핑 정보")
 
+class BatchTranslateReseponse(BaseModel):
+    """API 응답 모델 (일괄 번역)"""
+    translations: List[str] = Field(..., description="입력 순서대로 번역된 텍스트 목록")
+    word_mapping: List[WordMapping] = Field(default_factory=list, description="단어 매핑 정보")
+
+class ImproveReseponse(TranslateReseponse):
+    """API 응답 모델 (개선 번역 + 자체 평가)"""
+    score: int = Field(..., description="개선된 번역의 점수 (0-100)")
+    feedback: str = Field(..., description="개선된 번역에 대한 피드백")
+
 class EvaluationReseponse(BaseModel):
     """API 응답 모델"""
     score: int = Field(..., description="점수 (0-100)")
     feedback: str = Field(..., description="피드백 내용 (예: '문법 오류', '자연스러운 번역')")
 
 
-class Prompt(ABC):
-    """프롬프트 모델"""
-
-    def __init__(self,source_lang: str, target_lang: str):
-        self.source_lang = get_language_name(source_lang)
-        self.target_lang = get_language_name(target_lang)
-        self._parts = []
-
-    def _add_part(self, text):
-        """내부적으로 프롬프트 부분을 추가"""
-        self._parts.append(text)
-        return self
-    
-    def CUSTOM(self, text):
-        """사용자 정의 프롬프트 부분 추가"""
-        self._add_part(text)
-        return self
-    
-    def build(self):
-        """최종 프롬프트 문자열 반환"""
-        return "\n\n".join(self._parts)
-
-class SystemPrompt(Prompt):
-    """
-    번역 시스템 프롬프트를 구성하는 함수입니다.
-    각 섹션별로 메서드를 제공하여 필요에 따라 프롬프트를 구성할 수 있습니다.
-    
-    Args:
-        source_lang: 원본 언어
-        target_lang: 대상 언어
-        
-    Returns:
-        SystemPrompt 객체: 프롬프트 구성을 위한 메서드를 포함하는 객체
-    """
-    def __init__(self, source_lang, target_lang):
-        super().__init__(source_lang, target_lang)
-
-        # 기본 소개 부분 추가
-        prompt = f"""You are a professional translator from '{self.source_lang}' to '{self.target_lang}'.
+@lru_cache(maxsize=64)
+def _system_intro(source_lang: str, target_lang: str) -> str:
+    """번역 시스템 프롬프트의 기본 소개 부분"""
+    return f"""You are a professional translator from '{source_lang}' to '{target_lang}'.
 Translate the text exactly as provided, maintaining the original meaning, tone, nuance, and punctuation."""
-        
-        self._add_part(prompt)
-    
-    def CRITICAL(self):
-        """중요 번역 규칙 추가"""
-        #- Translate EVERYTHING - do not omit any part of the original text
-        prompt = f"""CRITICAL TRANSLATION RULES:
-- Use ONLY '{self.target_lang}' language in your translation - NO foreign words, NO mixing languages
-- If there is no corresponding translation, write it as it is pronounced in '{self.target_lang}'.
+
+@lru_cache(maxsize=64)
+def _critical(target_lang: str) -> str:
+    """중요 번역 규칙"""
+    #- Translate EVERYTHING - do not omit any part of the original text
+    return f"""CRITICAL TRANSLATION RULES:
+- Use ONLY '{target_lang}' language in your translation - NO foreign words, NO mixing languages
+- If there is no corresponding translation, write it as it is pronounced in '{target_lang}'.
 - Preserve ALL punctuation including periods, commas, ellipses (...), exclamation marks, etc.
 - Maintain the intensity and emotion of the original text
-- Translate idioms and expressions naturally into '{self.target_lang}' culture
+- Translate idioms and expressions naturally into '{target_lang}' culture
 - Provide ONLY the translated text with no explanations or notes        
 - Return only translated results
 - DO NOT USE md5 format
 - If there is a previous translation history, the tone should be the same.
 - PRIORITIZE CONSISTENCY: If provided with previous translation terms in 'references', use these translations for consistency unless they significantly distort the meaning in the current context
 - Mistakes decrease trustworthiness. Verify and answer accurately to avoid mistakes."""
-        
-        self._add_part(prompt)
-        return self
-    
-    def WORD_MAPPING(self):
-        """단어 매핑 지침 추가"""
 
-        prompt = f"""## TRANSLATION DICTIONARY USAGE:
+@lru_cache(maxsize=64)
+def _word_mapping(target_lang: str) -> str:
+    """단어 매핑 지침"""
+    return f"""## TRANSLATION DICTIONARY USAGE:
 When translating, use the provided translation dictionary to ensure consistency with previously translated terms. The dictionary is organized by categories to help you find relevant translations quickly.
 
 ### Dictionary Categories:
@@ -126,7 +104,7 @@ When translating, use the provided translation dictionary to ensure consistency
    
 ### Translation Process:
 1. When you encounter a word or phrase for translation, first check if it exists in any of the dictionary categories.
-2. If found, use the provided '{self.target_lang}' translation to maintain consistency.
+2. If found, use the provided '{target_lang}' translation to maintain consistency.
 3. If a word appears in multiple categories with different translations, consider the context to choose the appropriate translation.
 4. If not found, translate it appropriately and remember your translation for future consistency.
 5. For phrases and sentences, try to identify individual terms that have existing translations and integrate them into your complete translation.
@@ -145,30 +123,8 @@ When translating, use the provided translation dictionary to ensure consistency
 4. Verify that each term you include has a genuine translation (not identical to source)
 5. Use the appropriate category from the dictionary structure above for each word_mapping entry"""
 
-        self._add_part(prompt)
-        return self
-    
-    def REFERENCES(self, references=None):
-        """이전 번역 참조 정보 추가"""
-        if not references:
-            return self
-            
-        ref_text = "PREVIOUS TRANSLATION REFERENCES:\nTo ensure consistency, prioritize these translations for recurring terms:\n"
-        ref_items = []
-        
-        for ref in references:
-            if "term" in ref and "translation" in ref:
-                ref_items.append(f"- \"{ref['term']}\" → \"{ref['translation']}\"")
-        
-        if ref_items:
-            ref_text += "\n".join(ref_items)
-            self._add_part(ref_text)
-        
-        return self
-
-    def RESPONSE_FORMAT(self):
-        """응답 형식 추가"""
-        format_text = '''## RESPONSE RULE:
+# 응답 형식 (언어와 무관한 고정 문자열)
+_RESPONSE_FORMAT = '''## RESPONSE RULE:
 - The translation field should contain the full translated text.
 - The word_mapping field must be a list of key phrases or proper nouns in the original text, each with its translation and a category (e.g., "character_names", "place_names").
 - Return only the JSON response without additional explanation or formatting.
@@ -184,8 +140,190 @@ When translating, use the provided translation dictionary to ensure consistency
     { "word": "examine", "translation": "살펴보다", "category": "verbs" }
   ]
 }'''
-        self._add_part(format_text)
+
+# 번역 개선 응답 형식 (개선된 번역과 그 평가를 한 번에 응답)
+_IMPROVE_RESPONSE_FORMAT = '''## RESPONSE RULE:
+- The translation field should contain the full improved translation.
+- The word_mapping field must be a list of key phrases or proper nouns in the original text, each with its translation and a category (e.g., "character_names", "place_names").
+- The score field must rate the improved translation from 0 to 100 (Accuracy 40%, Fluency 30%, Terminology 20%, Completeness 10%). If it contains mixed languages, score it below 50.
+- The feedback field must briefly explain remaining issues or why it's good.
+- Return only the JSON response without additional explanation or formatting.
+- DO NOT USE md5 format
+- All values must be in valid JSON syntax.
+
+## RESPONSE FORMAT:
+{ 
+  "translation": "your improved translation here", 
+  "word_mapping": [
+    { "word": "Sara", "translation": "사라", "category": "proper_nouns" }
+  ],
+  "score": 92,
+  "feedback": "brief explanation"
+}'''
+
+# 일괄 번역 응답 형식
+_BATCH_RESPONSE_FORMAT = '''## RESPONSE RULE:
+- The input is a JSON array of independent texts. Translate each item separately.
+- The translations field must be a list with exactly one translation per input item, in the same order.
+- The word_mapping field must be a list of key phrases or proper nouns in the original texts, each with its translation and a category (e.g., "character_names", "place_names").
+- Return only the JSON response without additional explanation or formatting.
+- DO NOT USE md5 format
+- All values must be in valid JSON syntax.
+
+## RESPONSE FORMAT:
+{ 
+  "translations": ["translation of item 1", "translation of item 2"], 
+  "word_mapping": [
+    { "word": "Sara", "translation": "사라", "category": "proper_nouns" },
+    { "word": "Willsdrey Village", "translation": "윌스드레이 마을", "category": "place_names" }
+  ]
+}'''
+
+@lru_cache(maxsize=64)
+def _static_prompt(source_lang: str, target_lang: str, response_format: str = _RESPONSE_FORMAT) -> str:
+    """
+    기본 번역 시스템 프롬프트의 고정 부분(소개 → CRITICAL → WORD_MAPPING → 응답 형식)을 언어 쌍별로 캐시합니다.
+    참조 정보나 이전 번역처럼 요청마다 달라지는 부분은 이 뒤에 붙여, 같은 언어 쌍의 프롬프트 앞부분이
+    항상 동일하도록 합니다. (Ollama가 앞부분의 계산 결과를 재사용할 수 있음)
+    """
+    source_name = get_language_name(source_lang)
+    target_name = get_language_name(target_lang)
+    return f"{_system_intro(source_name, target_name)}\n\n{_critical(target_name)}\n\n{_word_mapping(target_name)}\n\n{response_format}"
+
+# 참조 정보 머리말과 항목 형식
+_REFERENCES_HEADER = "PREVIOUS TRANSLATION REFERENCES:\nTo ensure consistency, prioritize these translations for recurring terms:\n"
+_REFERENCE_LINE = '- "{}" → "{}"'
+
+def _reference_pairs_text(pairs) -> str:
+    """(용어, 번역) 쌍을 프롬프트 문자열로 변환합니다. 항목이 없으면 빈 문자열을 반환합니다."""
+    ref_items = "\n".join(_REFERENCE_LINE.format(term, translation) for term, translation in pairs)
+    if not ref_items:
+        return ""
+
+    return _REFERENCES_HEADER + ref_items
+
+def _references_text(references) -> str:
+    """참조 정보 목록을 프롬프트 문자열로 변환합니다. 유효한 항목이 없으면 빈 문자열을 반환합니다."""
+    if not references:
+        return ""
+
+    return _reference_pairs_text(
+        (ref["term"], ref["translation"])
+        for ref in references
+        if "term" in ref and "translation" in ref
+    )
+
+# 이전 번역 이력 머리말과 항목 형식
+_HISTORY_HEADER = "PREVIOUS TRANSLATIONS (for reference):\n"
+_HISTORY_LINE = '{}. Source: "{}"\n   Translation: "{}"'
+
+# 프롬프트에 포함할 최대 이전 번역 수
+HISTORY_PROMPT_SIZE = 5
+
+def _history_pairs_text(pairs) -> str:
+    """(원본, 번역) 쌍을 이전 번역 프롬프트 문자열로 변환합니다. 항목이 없으면 빈 문자열을 반환합니다."""
+    history_items = "\n".join(_HISTORY_LINE.format(i, source, translation) for i, (source, translation) in enumerate(pairs, 1))
+    if not history_items:
+        return ""
+
+    return _HISTORY_HEADER + history_items
+
+def _default_prompt(source_lang: str, target_lang: str, ref_text: str, history_text: str = "") -> str:
+    """캐시된 고정 부분 뒤에 참조 정보와 이전 번역을 붙여 기본 번역 시스템 프롬프트를 만듭니다."""
+    prompt = _static_prompt(source_lang, target_lang)
+    if ref_text:
+        prompt = f"{prompt}\n\n{ref_text}"
+    if history_text:
+        prompt = f"{prompt}\n\n{history_text}"
+    return prompt
+
+class Prompt(ABC):
+    """프롬프트 모델"""
+
+    def __init__(self,source_lang: str, target_lang: str):
+        self.source_lang = get_language_name(source_lang)
+        self.target_lang = get_language_name(target_lang)
+        self._parts = []
+        self._built = None
+
+    def _add_part(self, text):
+        """내부적으로 프롬프트 부분을 추가"""
+        self._parts.append(text)
+        self._built = None
         return self
+    
+    def CUSTOM(self, text):
+        """사용자 정의 프롬프트 부분 추가"""
+        self._add_part(text)
+        return self
+    
+    def build(self):
+        """최종 프롬프트 문자열 반환 (부분이 추가되기 전까지 결과 재사용)"""
+        if self._built is None:
+            self._built = "\n\n".join(self._parts)
+        return self._built
+
+class SystemPrompt(Prompt):
+    """
+    번역 시스템 프롬프트를 구성하는 함수입니다.
+    각 섹션별로 메서드를 제공하여 필요에 따라 프롬프트를 구성할 수 있습니다.
+    
+    Args:
+        source_lang: 원본 언어
+        target_lang: 대상 언어
+        
+    Returns:
+        SystemPrompt 객체: 프롬프트 구성을 위한 메서드를 포함하는 객체
+    """
+    def __init__(self, source_lang, target_lang):
+        super().__init__(source_lang, target_lang)
+
+        # 기본 소개 부분 추가
+        self._add_part(_system_intro(self.source_lang, self.target_lang))
+    
+    def CRITICAL(self):
+        """중요 번역 규칙 추가"""
+        self._add_part(_critical(self.target_lang))
+        return self
+    
+    def WORD_MAPPING(self):
+        """단어 매핑 지침 추가"""
+        self._add_part(_word_mapping(self.target_lang))
+        return self
+    
+    def REFERENCES(self, references=None):
+        """이전 번역 참조 정보 추가"""
+        ref_text = _references_text(references)
+        if ref_text:
+            self._add_part(ref_text)
+        
+        return self
+
+    def RESPONSE_FORMAT(self):
+        """응답 형식 추가"""
+        self._add_part(_RESPONSE_FORMAT)
+        return self
+
+    def IMPROVE_RESPONSE_FORMAT(self):
+        """번역 개선 응답 형식 추가 (개선된 번역과 자체 평가 점수/피드백)"""
+        self._add_part(_IMPROVE_RESPONSE_FORMAT)
+        return self
+
+    @classmethod
+    def build_default(cls, source_lang: str, target_lang: str, references=None) -> str:
+        """
+        기본 구성(CRITICAL → WORD_MAPPING → RESPONSE_FORMAT → REFERENCES)의 프롬프트를
+        빌더를 거치지 않고 언어 쌍별로 캐시된 고정 부분에 참조 정보만 붙여 생성합니다.
+
+        Args:
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            references: 참조 정보 목록 [{"term": "원본", "translation": "번역"}]
+
+        Returns:
+            str: 번역 시스템 프롬프트
+        """
+        return _default_prompt(source_lang, target_lang, _references_text(references))
 
 class ImprovePrompt(Prompt):
     """
@@ -230,4 +368,57 @@ YOU MUST RETURN ONLY A VALID JSON OBJECT with this exact format:
 
 No additional text before or after the JSON. Only the JSON object.
 NOT USE md5 format."""
-        self._add_part(prompt)
\ No newline at end of file
+        self._add_part(prompt)
+
+
+@lru_cache(maxsize=256)
+def _build_system_prompt(source_lang: str, target_lang: str, references: Tuple[Tuple[str, str], ...], history: Tuple[Tuple[str, str], ...] = ()) -> str:
+    """언어 쌍, 참조 정보, 이전 번역 조합별로 완성된 번역 시스템 프롬프트를 캐시합니다."""
+    return _default_prompt(source_lang, target_lang, _reference_pairs_text(references), _history_pairs_text(history))
+
+def build_system_prompt(source_lang: str, target_lang: str, references: Optional[List[Dict[str, str]]] = None, history: Optional[List[Dict[str, Any]]] = None) -> str:
+    """
+    사전 참조 정보와 이전 번역 이력을 포함한 번역 시스템 프롬프트를 반환합니다.
+    동일한 언어 쌍, 참조 정보, 이전 번역 조합은 미리 만들어진 프롬프트를 재사용합니다.
+
+    Args:
+        source_lang: 원본 언어 코드
+        target_lang: 대상 언어 코드
+        references: 참조 정보 목록 [{"term": "원본", "translation": "번역"}]
+        history: 번역 이력 목록 [{"source_text": "원본", "translated_text": "번역"}] (최근 HISTORY_PROMPT_SIZE개 사용)
+
+    Returns:
+        str: 번역 시스템 프롬프트
+    """
+    key = tuple(
+        (ref["term"], ref["translation"])
+        for ref in references or ()
+        if "term" in ref and "translation" in ref
+    )
+    # 참조 정보에 이미 있는 원본은 이전 번역에서 제외 (같은 내용을 두 번 보내지 않음)
+    ref_terms = {term for term, _ in key}
+    history_key = tuple(
+        (item["source_text"], item["translated_text"])
+        for item in history or ()
+        if item["source_text"] not in ref_terms
+    )[-HISTORY_PROMPT_SIZE:]
+    return _build_system_prompt(source_lang, target_lang, key, history_key)
+
+def build_batch_system_prompt(source_lang: str, target_lang: str, references: Optional[List[Dict[str, str]]] = None) -> str:
+    """
+    여러 텍스트를 한 번에 번역하기 위한 시스템 프롬프트를 반환합니다.
+    기본 번역 프롬프트와 같은 고정 앞부분을 사용하고 응답 형식만 일괄 번역용으로 바꿉니다.
+
+    Args:
+        source_lang: 원본 언어 코드
+        target_lang: 대상 언어 코드
+        references: 참조 정보 목록 [{"term": "원본", "translation": "번역"}]
+
+    Returns:
+        str: 일괄 번역 시스템 프롬프트
+    """
+    prompt = _static_prompt(source_lang, target_lang, _BATCH_RESPONSE_FORMAT)
+    ref_text = _references_text(references)
+    if ref_text:
+        return f"{prompt}\n\n{ref_text}"
+    return prompt
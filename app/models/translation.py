@@ -0,0 +1,12 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+class TranslateBatchRequest(BaseModel):
+    """일괄 번역 요청 모델"""
+    from_lang: str = Field(..., alias="from", min_length=1, description="원본 언어 코드")
+    to: str = Field(..., description="대상 언어 코드")
+    texts: List[str] = Field(..., min_length=1, max_length=100, description="번역할 텍스트 목록")
+
+class TranslateBatchResponse(BaseModel):
+    """일괄 번역 응답 모델"""
+    translations: List[str] = Field(..., description="입력 순서대로 번역된 텍스트 목록")
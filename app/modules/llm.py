@@ -1,10 +1,15 @@
 import time
+import hashlib
 import logging
 import asyncio
+import functools
+import contextlib
 from abc import ABC, abstractmethod
-from typing import List
-from datetime import datetime
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
 
+import httpx
+import orjson
 from ollama import AsyncClient
 from pydantic import BaseModel
 
@@ -37,6 +42,108 @@ class BaseLLM(ABC):
         """
         pass
 
+def keep_alive_value(value: str):
+    """keep_alive 설정값을 Ollama API 형식으로 변환합니다. (숫자는 초 단위 정수, 그 외는 "24h" 같은 기간 문자열)"""
+    value = value.strip()
+    return int(value) if value.lstrip("-").isdigit() else value
+
+# ===== 응답 캐시 =====
+
+# 모델 핑 요청 메시지
+_PING_CONTENT = "just only say pong"
+_PING_MESSAGES = [{"role": "user", "content": _PING_CONTENT}]
+
+# chat 호출 시 허용되는 생성 옵션
+_OPTION_KEYS = frozenset(("temperature", "max_tokens", "top_p", "timeout", "stop"))
+
+# 결과가 결정적이지 않을 수 있어 캐시하지 않는 옵션
+_UNCACHEABLE_OPTIONS = ("temperature", "stop")
+
+class ResponseCache:
+    """
+    동일한 LLM 요청에 대한 응답을 일정 시간 동안 보관하는 인메모리 캐시
+
+    가장 오래 사용되지 않은 항목부터 제거하며, 만료된 항목은 조회 시 제거합니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: int = settings.CACHE_EXPIRATION):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 응답을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """응답을 캐시에 저장합니다."""
+        self._items[key] = (time.monotonic() + self.ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+# 응답 형식 모델별 JSON 스키마 캐시
+_SCHEMA_CACHE: Dict[type, dict] = {}
+
+def _resolve_format(format: Any) -> Any:
+    """응답 형식이 pydantic 모델 클래스이면 캐시된 JSON 스키마로 변환합니다."""
+    if isinstance(format, type) and issubclass(format, BaseModel):
+        schema = _SCHEMA_CACHE.get(format)
+        if schema is None:
+            schema = _SCHEMA_CACHE[format] = format.model_json_schema()
+        return schema
+    return format
+
+def _cache_key(model: str, messages: List[Union[Message, Dict[str, str]]], format: Any, options: Dict[str, Any]) -> str:
+    """모델, 메시지, 응답 형식, 생성 옵션으로 캐시 키를 생성합니다."""
+    serialized = orjson.dumps(
+        {
+            "model": model,
+            "messages": [m.model_dump() if isinstance(m, BaseModel) else m for m in messages],
+            "format": format,
+            "options": options,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+def cached_chat(func):
+    """
+    OllamaLLM.chat 응답을 캐시하는 데코레이터
+
+    동일한 모델/메시지/형식/생성 옵션의 요청은 Ollama를 호출하지 않고 캐시된 응답을 반환합니다.
+    temperature, stop 등 결과를 바꾸는 옵션이 지정된 요청은 캐시하지 않습니다.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, messages: List[Union[Message, Dict[str, str]]], model: str = None, format: Union[Type[BaseModel], dict, str] = None, **kwargs):
+        format = _resolve_format(format)
+        if not settings.ENABLE_CACHE or any(key in kwargs for key in _UNCACHEABLE_OPTIONS):
+            return await func(self, messages, model=model, format=format, **kwargs)
+
+        # 응답에 영향을 주는 옵션은 모두 키에 포함 (timeout은 응답 내용과 무관하므로 제외)
+        options = {name: value for name, value in kwargs.items() if name in _OPTION_KEYS and name != "timeout"}
+        key = _cache_key(model or self.model, messages, format, options)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug("LLM 응답 캐시 히트: %s", key)
+            return cached
+
+        response = await func(self, messages, model=model, format=format, **kwargs)
+        self.cache.set(key, response)
+        return response
+
+    return wrapper
+
 # ===== Ollama LLM 클라이언트 =====
 
 class OllamaLLM(BaseLLM):
@@ -56,14 +163,35 @@ class OllamaLLM(BaseLLM):
             api_base (str, 선택): Ollama API 기본 URL
             model (str, 선택): 사용할 Ollama 모델 이름
         """
-        self.client = AsyncClient( host=api_base )
+        # 요청 간 연결을 재사용하도록 커넥션 풀 크기와 keep-alive 시간 설정
+        # (종료 시 ollama 클라이언트 내부 속성에 의존하지 않고 직접 닫을 수 있도록 전송 계층을 보관)
+        self._transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=settings.OLLAMA_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=60.0
+            )
+        )
+        self.client = AsyncClient(
+            host=api_base,
+            transport=self._transport
+        )
         self.model = model
         self.timeout = settings.OLLAMA_TIMEOUT # 기본 타임아웃 설정 (초 단위)
+        # 모델 메모리 유지 시간. Ollama는 요청마다 keep_alive를 적용하고 생략하면 서버 기본값(5분)으로 되돌리므로 모든 요청에 지정
+        self.keep_alive = keep_alive_value(settings.OLLAMA_KEEP_ALIVE)
+        self.cache = ResponseCache() # 동일 요청 응답 캐시
+        # 동시 LLM 요청 수 제한 (초과 요청은 대기하여 Ollama 과부하 방지)
+        self._semaphore = asyncio.Semaphore(settings.OLLAMA_MAX_CONCURRENCY) if settings.OLLAMA_MAX_CONCURRENCY > 0 else None
 
     def get_client(self):
         """Ollama API 클라이언트를 반환합니다."""
         return self.client
 
+    async def close(self):
+        """Ollama API 클라이언트의 연결을 닫습니다."""
+        await self._transport.aclose()
+
     # async def load(self, model_name: str, max_retries=10, retry_delay=5):
     #     """Ollama 모델을 로드합니다."""
     #     model = model_name or self.model
@@ -208,46 +336,199 @@ class OllamaLLM(BaseLLM):
 
     async def ping(self, timeout:int = settings.OLLAMA_TIMEOUT):
         """Ollama API에 연결합니다."""
-        logger.debug(f"OLLAMA 호스트: {settings.OLLAMA_BASE_URL}, 모델 핑: {self.model}, 타임아웃: {timeout}초, content: just only say pong")
+        logger.debug("OLLAMA 호스트: %s, 모델 핑: %s, 타임아웃: %s초, content: %s", settings.OLLAMA_BASE_URL, self.model, timeout, _PING_CONTENT)
         async with asyncio.timeout(timeout):
             try:
-                response = await self.client.chat(model=self.model, messages=[{'role': 'user', 'content': 'just only say pong'}])
+                response = await self.client.chat(model=self.model, messages=_PING_MESSAGES, keep_alive=self.keep_alive)
                 return response
             except Exception as e:
                 logger.error(f"모델 핑 실패: {str(e)}")
                 raise RuntimeError(f"모델 핑 실패: {str(e)}") from e
     
-    async def chat(self, messages: List[Message], model: str = None, format: BaseModel = None, **kwargs):
+    @cached_chat
+    async def chat(self, messages: List[Union[Message, Dict[str, str]]], model: str = None, format: Union[Type[BaseModel], dict, str] = None, **kwargs):
+
+        # 지원하는 옵션만 추출 (timeout은 요청 단위로만 사용하고 Ollama 옵션에서는 제외)
+        options = {key: value for key, value in kwargs.items() if key in _OPTION_KEYS}
+        timeout = options.pop("timeout", None) or self.timeout
 
-        if model is None:
-            model = self.model
-    
         payload = {
-            "model": model,
+            "model": model or self.model,
             "messages": messages,
-            "format": format,
+            "format": _resolve_format(format),
             "stream": False,
-            "options": {}
+            "options": options,
+            "keep_alive": self.keep_alive
         }
 
-        options_item = ["temperature", "max_tokens", "top_p", "timeout", "stop"]
+        return await self._send(payload, timeout)
+
+    async def chat_stream(self, messages: List[Union[Message, Dict[str, str]]], model: str = None, format: Union[Type[BaseModel], dict, str] = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Ollama chat API 응답을 스트리밍으로 받아 생성되는 내용을 조각 단위로 반환합니다.
+        응답 캐시와 배치 전송은 사용하지 않으며, 동시 요청 수 제한과 타임아웃은 스트림 전체에 적용됩니다.
+
+        Args:
+            messages: 채팅 메시지 목록
+            model: 사용할 모델 (없으면 기본 모델)
+            format: 응답 형식 (pydantic 모델 클래스, JSON 스키마 또는 "json")
+
+        Returns:
+            AsyncIterator[str]: 응답 내용 조각
+        """
+        options = {key: value for key, value in kwargs.items() if key in _OPTION_KEYS}
+        timeout = options.pop("timeout", None) or self.timeout
 
-        # 기본 옵션 설정
-        for key in options_item:
-            if key in kwargs:
-                payload["options"][key] = kwargs[key]
+        async with self._semaphore or contextlib.nullcontext():
+            async with asyncio.timeout(timeout):
+                stream = await self.client.chat(
+                    model=model or self.model,
+                    messages=messages,
+                    format=_resolve_format(format),
+                    stream=True,
+                    options=options,
+                    keep_alive=self.keep_alive
+                )
+                async for chunk in stream:
+                    yield chunk["message"]["content"]
 
-        timeout = self.timeout
-        if payload["options"].get("timeout"):
-            self.timeout = payload["options"]["timeout"]            
+    async def _send(self, payload: dict, timeout: float):
+        """Ollama chat API로 요청을 전송합니다. 동시 요청 수 제한을 넘으면 순서를 기다립니다."""
+        if self._semaphore is None:
+            return await self._chat(payload, timeout)
 
+        async with self._semaphore:
+            return await self._chat(payload, timeout)
+
+    async def _chat(self, payload: dict, timeout: float):
+        """Ollama chat API를 호출합니다. (타임아웃은 실제 요청 시간에만 적용)"""
         # 타임아웃 컨텍스트 매니저 사용
         async with asyncio.timeout(timeout):
-            # 나머지 코드는 동일...
             response = await self.client.chat(
                 **payload
             )
 
-        return response    
+        return response
+
+class BatchingOllamaLLM(OllamaLLM):
+    """
+    동시 요청을 짧은 시간 동안 모아서 전송하는 Ollama LLM 클라이언트
+
+    Ollama chat API는 다중 프롬프트 요청을 지원하지 않으므로, 모인 요청을 모델별로
+    묶어 하나의 클라이언트에서 동시에 전송합니다. 같은 모델의 요청이 연속해서
+    도착하므로 여러 모델을 사용할 때 모델 교체가 줄어듭니다.
+    """
+
+    def __init__(self,
+                 api_base: str = settings.OLLAMA_BASE_URL,
+                 model: str = settings.OLLAMA_MODEL,
+                 max_batch: int = settings.BATCH_MAX_SIZE,
+                 max_wait_ms: int = settings.BATCH_MAX_WAIT_MS ):
+        """
+        배치 Ollama LLM 초기화
+
+        Args:
+            api_base (str, 선택): Ollama API 기본 URL
+            model (str, 선택): 사용할 Ollama 모델 이름
+            max_batch (int, 선택): 한 번에 전송할 최대 요청 수
+            max_wait_ms (int, 선택): 배치를 모으기 위해 대기하는 최대 시간 (밀리초)
+        """
+        super().__init__(api_base=api_base, model=model)
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._inflight: set = set()  # 전송 중인 배치 작업 (가비지 컬렉션 방지)
+
+    async def _send(self, payload: dict, timeout: float):
+        """요청을 배치 큐에 넣고 결과를 기다립니다."""
+        if self._consumer is None or self._consumer.done():
+            self._queue = asyncio.Queue()
+            self._consumer = asyncio.create_task(self._batch_consumer())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((payload, timeout, future))
+        return await future
+
+    async def _dispatch(self, payload: dict, timeout: float, future: asyncio.Future) -> None:
+        """단일 요청을 전송하고 결과를 대기 중인 호출자에게 전달합니다."""
+        try:
+            response = await super()._send(payload, timeout)
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        else:
+            if not future.done():
+                future.set_result(response)
+
+    async def _batch_consumer(self) -> None:
+        """큐에서 요청을 모아 모델별로 묶어 동시에 전송합니다."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            # 처리 중인 배치가 없고 대기 요청도 없으면 기다리지 않고 바로 전송 (단독 요청 지연 방지)
+            collect = bool(self._inflight) or not self._queue.empty()
+
+            try:
+                while collect and len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # 수집 중에 종료되면 이미 꺼낸 요청도 실패 처리
+                self._fail_pending(item[2] for item in batch)
+                raise
+
+            # 모델별로 묶어서 전송 (다음 배치 수집은 응답을 기다리지 않고 계속)
+            batch.sort(key=lambda item: item[0]["model"])
+            logger.debug("배치 전송: %d개 요청", len(batch))
+            task = asyncio.ensure_future(asyncio.gather(
+                *(self._dispatch(payload, timeout, future) for payload, timeout, future in batch),
+                return_exceptions=True
+            ))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    @staticmethod
+    def _fail_pending(futures) -> None:
+        """결과를 기다리는 호출자에게 클라이언트 종료 오류를 전달합니다."""
+        for future in futures:
+            if not future.done():
+                future.set_exception(RuntimeError("Ollama LLM 클라이언트가 종료되었습니다."))
+
+    async def close(self):
+        """배치 수집 작업과 전송 중인 배치를 취소하고, 대기 중인 요청을 실패 처리한 뒤 연결을 닫습니다."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+        # 전송 중인 배치 취소 (각 요청의 호출자에게는 CancelledError가 전달됨)
+        inflight = list(self._inflight)
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+
+        # 아직 큐에 남아 있는 요청 실패 처리
+        if self._queue is not None:
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait()[2])
+            self._fail_pending(pending)
+            self._queue = None
+
+        await super().close()
 
-ollamac = OllamaLLM()
\ No newline at end of file
+ollamac = BatchingOllamaLLM() if settings.ENABLE_BATCHING else OllamaLLM()
\ No newline at end of file
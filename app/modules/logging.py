@@ -4,24 +4,121 @@ UTF-8 지원 로깅 서비스 (logging_service.py)
 주요 개선사항:
 1. 모든 로그 파일을 UTF-8로 작성하도록 개선
 2. 파일 핸들러에 인코딩 설정 추가
+3. 요청 경로에서 파일 쓰기를 제거하고 백그라운드 큐로 일괄 기록
+4. 번역/평가/오류 로그를 kind 필드로 구분하여 하나의 파일에 기록
 """
+import time
+import asyncio
 import logging
-import json
-from datetime import datetime
-from typing import Dict, Any
-import codecs
+from typing import Dict, Any, List, Optional
+
+import aiofiles
+import orjson
 
 from app.settings import SRC_LOG_LEVELS
 
 logger = logging.getLogger(__name__)
 logger.setLevel( SRC_LOG_LEVELS["MODULE"] )
 
+# 로그 파일 경로 (번역/평가/오류 이벤트를 kind 필드로 구분)
+EVENTS_LOG = "logs/events.jsonl"
+
+# 백그라운드 기록 설정
+LOG_BATCH_SIZE = 100     # 한 번에 기록할 최대 항목 수
+LOG_BATCH_WAIT = 0.05    # 배치를 모으기 위해 대기하는 최대 시간 (초)
+
+# 로그 직렬화 옵션 (줄바꿈 포함 UTF-8 바이트로 출력)
+_DUMPS_OPTION = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+def _dumps(log_data: Dict[str, Any]) -> bytes:
+    """로그 데이터를 JSONL 한 줄(UTF-8 바이트)로 직렬화합니다."""
+    return orjson.dumps(log_data, default=str, option=_DUMPS_OPTION)
+
 class TranslationLogger:
+    # 기록 대기 중인 로그 큐. None은 종료 신호
+    _queue: asyncio.Queue = asyncio.Queue()
+    _writer_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start(cls) -> None:
+        """백그라운드 로그 기록 작업을 시작합니다."""
+        if cls._writer_task is None or cls._writer_task.done():
+            cls._writer_task = asyncio.create_task(cls._log_writer())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """남은 로그를 모두 기록한 뒤 백그라운드 작업을 종료합니다."""
+        if cls._writer_task is None:
+            return
+
+        cls._queue.put_nowait(None)
+        try:
+            await cls._writer_task
+        finally:
+            cls._writer_task = None
+
+    @classmethod
+    def _enqueue(cls, log_data: Dict[str, Any]) -> None:
+        """로그 데이터를 기록 큐에 추가합니다. 작업이 없으면 즉시 기록합니다."""
+        if cls._writer_task is not None and not cls._writer_task.done():
+            cls._queue.put_nowait(log_data)
+            return
+
+        try:
+            with open(EVENTS_LOG, "ab") as f:
+                f.write(_dumps(log_data))
+        except Exception as e:
+            logger.error(f"로그 파일 쓰기 오류: {EVENTS_LOG}, {str(e)}")
+
+    @classmethod
+    async def _log_writer(cls) -> None:
+        """큐에 쌓인 로그를 모아 한 번에 기록합니다."""
+        loop = asyncio.get_running_loop()
+        f = None
+        running = True
+
+        try:
+            while running:
+                item = await cls._queue.get()
+                if item is None:
+                    break
+
+                batch: List[Dict[str, Any]] = [item]
+                deadline = loop.time() + LOG_BATCH_WAIT
+
+                # 짧은 시간 동안 추가 로그를 모아서 기록
+                while len(batch) < LOG_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(cls._queue.get(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is None:
+                        running = False
+                        break
+                    batch.append(item)
+
+                try:
+                    if f is None:
+                        f = await aiofiles.open(EVENTS_LOG, "ab")
+                    await f.write(b"".join(_dumps(r) for r in batch))
+                    await f.flush()
+                except Exception as e:
+                    logger.error(f"로그 파일 쓰기 오류: {EVENTS_LOG}, {str(e)}")
+        finally:
+            if f is not None:
+                try:
+                    await f.close()
+                except Exception:
+                    pass
+
     @staticmethod
     def log_translation(source_lang: str, target_lang: str, source_text: str, translated_text: str) -> None:
         """
         번역 요청과 결과를 로그에 기록합니다.
-        
+
         Args:
             source_lang: 원본 언어 코드
             target_lang: 대상 언어 코드
@@ -34,31 +131,28 @@ class TranslationLogger:
             source_text = ""
         if translated_text is None:
             translated_text = ""
-            
+
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "kind": "translation",
+            "timestamp": time.time_ns(),
             "source_language": source_lang,
             "target_language": target_lang,
             "source_text": source_text,
             "translated_text": translated_text,
             "characters": len(source_text) if source_text else 0
         }
-        
+
         # 콘솔에 로그 출력
-        logger.debug(f"번역: {source_lang} -> {target_lang}, 원본: '{source_text}', 번역: '{translated_text}'")
-        
+        logger.debug("번역: %s -> %s, 원본: '%s', 번역: '%s'", source_lang, target_lang, source_text, translated_text)
+
         # JSON 형식으로 로그 파일에 저장 (UTF-8 인코딩)
-        try:
-            with codecs.open("logs/translations.jsonl", "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_data, ensure_ascii=False) + "\n")
-        except Exception as e:
-            logger.error(f"로그 파일 쓰기 오류: {str(e)}")
-    
+        TranslationLogger._enqueue(log_data)
+
     @staticmethod
     def log_evaluation(source_text: str, translated_text: str, score: int, feedback: str) -> None:
         """
         번역 품질 평가 결과를 로그에 기록합니다.
-        
+
         Args:
             source_text: 원본 텍스트
             translated_text: 번역된 텍스트
@@ -66,43 +160,36 @@ class TranslationLogger:
             feedback: 평가 피드백
         """
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "kind": "evaluation",
+            "timestamp": time.time_ns(),
             "source_text": source_text,
             "translated_text": translated_text,
             "quality_score": score,
             "feedback": feedback
         }
-        
+
         # 콘솔에 로그 출력
         logger.info(f"번역 품질 평가: 점수={score}, 피드백: '{feedback}'")
-        
+
         # JSON 형식으로 로그 파일에 저장 (UTF-8 인코딩)
-        try:
-            with codecs.open("logs/evaluations.jsonl", "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_data, ensure_ascii=False) + "\n")
-        except Exception as e:
-            logger.error(f"평가 로그 파일 쓰기 오류: {str(e)}")
-            
+        TranslationLogger._enqueue(log_data)
+
     @staticmethod
     def log_error(error_type: str, details: Dict[str, Any]) -> None:
         """
         오류를 로그에 기록합니다.
-        
+
         Args:
             error_type: 오류 유형
             details: 오류 관련 세부 정보
         """
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "kind": "error",
+            "timestamp": time.time_ns(),
             "error_type": error_type,
             "details": details
         }
-        
-        logger.error(f"오류: {error_type} - {json.dumps(details, ensure_ascii=False)}")
-        
-        try:
-            with codecs.open("logs/errors.jsonl", "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_data, ensure_ascii=False) + "\n")
-        except Exception as e:
-            logger.error(f"오류 로그 파일 쓰기 오류: {str(e)}")
 
+        logger.error(f"오류: {error_type} - {orjson.dumps(details, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')}")
+
+        TranslationLogger._enqueue(log_data)
@@ -2,27 +2,67 @@ import logging
 
 import asyncio
 import time
+from typing import List, Optional, Tuple
 
-from app.modules.llm import ollamac
+from app.modules.llm import ollamac, keep_alive_value
 
 from app.settings import SRC_LOG_LEVELS, settings
 
 logger = logging.getLogger(__name__)
 logger.setLevel(SRC_LOG_LEVELS["MODULE"])
 
+# 모델 다운로드 진행 상황 출력 최소 간격 (초)
+PROGRESS_PRINT_INTERVAL = 0.2
+
 class OllamaManager:
     """
     Ollama 모델 관리 및 다운로드를 위한 클래스입니다.
     Ollama API를 사용하여 모델을 다운로드하고 로드하며, 모델이 VRAM에서 제거되지 않도록 핑을 보냅니다.
     """
+    # 모델 목록 캐시 유지 시간 (초)
+    MODEL_LIST_TTL = 2.0
+    
+    # 서버 확인 결과 유지 시간 (초)
+    SERVER_OK_TTL = 60.0
 
     def __init__(self):
         self.client = ollamac.get_client()
         self.ping_task = None
         self._shutdown_event = asyncio.Event()
+        # (조회 시각, 모델 이름 목록)
+        self._model_list_cache: Optional[Tuple[float, List[str]]] = None
+        # 서버 확인 결과를 재사용할 수 있는 시각 (time.monotonic 기준)
+        self._server_ok_until: Optional[float] = None
+
+    async def list_models(self) -> List[str]:
+        """사용 가능한 모델 이름 목록을 반환합니다. 짧은 시간 동안은 캐시된 목록을 재사용합니다."""
+        now = time.monotonic()
+        if self._model_list_cache and now - self._model_list_cache[0] < self.MODEL_LIST_TTL:
+            return self._model_list_cache[1]
+        
+        response = await self.client.list()
+        models = [m.model for m in response.models]
+        self._model_list_cache = (now, models)
+        return models
+
+    async def _cancellable_sleep(self, timeout) -> bool:
+        """
+        종료 이벤트를 감지하면서 대기합니다.
+        
+        Returns:
+            bool: 대기 중 종료가 요청되었으면 True
+        """
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     async def check_server(self, max_retries=10, retry_delay=5):
-        """Ollama 서버가 실행 중인지 확인합니다."""
+        """Ollama 서버가 실행 중인지 확인합니다. 최근에 확인했으면 다시 요청하지 않습니다."""
+        if self._server_ok_until is not None and time.monotonic() < self._server_ok_until:
+            return True
+        
         for attempt in range(max_retries):
             if self._shutdown_event.is_set():
                 logger.info("서버 확인 작업이 취소되었습니다.")
@@ -32,10 +72,13 @@ class OllamaManager:
                     # 올라마 서버 상태 확인
                     health_response = await self.client.ps()
                     logger.debug(f"올라마 서버 준비 완료: {health_response}")
+                    self._server_ok_until = time.monotonic() + self.SERVER_OK_TTL
                     return True
                 except Exception as e:
                     logger.warning(f"올라마 서버 준비 중... 재시도 {attempt+1}/{max_retries}: {str(e)}")
-                    await asyncio.sleep(retry_delay)
+                    if await self._cancellable_sleep(retry_delay):
+                        logger.info("서버 확인 작업이 취소되었습니다.")
+                        return False
         
         raise RuntimeError("올라마 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
 
@@ -43,8 +86,7 @@ class OllamaManager:
         """모델이 이미 로드되어 있는지 확인합니다."""
         for attempt in range(max_retries):
             try:
-                response = await self.client.list()
-                available_models = [m.model for m in response.models]
+                available_models = await self.list_models()
                 logger.debug(f"사용 가능한 모델: {available_models}")
                 
                 # 정확히 일치하는지 확인
@@ -66,7 +108,8 @@ class OllamaManager:
                 logger.warning(f"모델 목록 조회 실패, 재시도 {attempt+1}/{max_retries}: {str(e)}")
                 if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(retry_delay)
+                if await self._cancellable_sleep(retry_delay):
+                    raise RuntimeError("모델 목록 조회가 취소되었습니다.") from e
 
     async def download_model(self, model_name, max_retries=10, retry_delay=5):
         """Ollama 모델을 다운로드합니다."""
@@ -86,43 +129,55 @@ class OllamaManager:
             # 진행 상태 변수 초기화
             current_status = ""
             last_status_update = ""
+            last_print_time = 0.0
             download_started = time.time()
             
             async for progress in await self.client.pull(model=model_name, stream=True):
+                if 'status' not in progress:
+                    continue
+                
+                status = progress.get('status', '')
+                status_changed = current_status != status
+                
+                # 상태가 바뀌지 않았으면 출력 간격(PROGRESS_PRINT_INTERVAL) 동안은 건너뛰기
+                now = time.monotonic()
+                if not status_changed and now - last_print_time < PROGRESS_PRINT_INTERVAL:
+                    continue
+                last_print_time = now
+                
                 # 진행 상황 출력
-                current_time = time.time()
-                elapsed = current_time - download_started
+                elapsed = time.time() - download_started
                 elapsed_str = f"{int(elapsed // 60)}분 {int(elapsed % 60)}초"
                 
-                if 'status' in progress:
-                    status = progress.get('status', '')
-                    
-                    # 상태가 변경된 경우 새 줄에 출력
-                    if current_status != status:
-                        if current_status:  # 이전 상태가 있었으면 줄바꿈
-                            print()
-                        current_status = status
-                        print(f"상태: {status}", end="")
-                    
-                    status_update = ""
-                    if 'download' in progress:
-                        download_info = progress.get('download', {})
-                        completed = download_info.get('completed', 0)
-                        total = download_info.get('total', 0)
-                        
-                        if total > 0:
-                            percent = (completed / total) * 100
-                            status_update = f" - {completed}/{total} ({percent:.2f}%) - 경과: {elapsed_str}"
-                    elif 'digest' in progress:
-                        digest = progress.get('digest', '')
-                        status_update = f" - 다이제스트: {digest[:10]}... - 경과: {elapsed_str}"
-                    else:
-                        status_update = f" - 경과: {elapsed_str}"
+                # 상태가 변경된 경우 새 줄에 출력
+                if status_changed:
+                    if current_status:  # 이전 상태가 있었으면 줄바꿈
+                        print()
+                    current_status = status
+                    print(f"상태: {status}", end="")
+                
+                status_update = ""
+                if 'download' in progress:
+                    download_info = progress.get('download', {})
+                    completed = download_info.get('completed', 0)
+                    total = download_info.get('total', 0)
                     
-                    # 상태 업데이트가 변경된 경우만 갱신
-                    if status_update != last_status_update:
-                        last_status_update = status_update
-                        print(f"\r상태: {status}{status_update}", end="")
+                    if total > 0:
+                        percent = (completed / total) * 100
+                        status_update = f" - {completed}/{total} ({percent:.2f}%) - 경과: {elapsed_str}"
+                elif 'digest' in progress:
+                    digest = progress.get('digest', '')
+                    status_update = f" - 다이제스트: {digest[:10]}... - 경과: {elapsed_str}"
+                else:
+                    status_update = f" - 경과: {elapsed_str}"
+                
+                # 상태 업데이트가 변경된 경우만 갱신
+                if status_update != last_status_update:
+                    last_status_update = status_update
+                    print(f"\r상태: {status}{status_update}", end="")
+            
+            # 모델 목록이 변경되었으므로 캐시 무효화
+            self._model_list_cache = None
             
             # 총 소요 시간 계산
             end_time = time.time()
@@ -145,15 +200,23 @@ class OllamaManager:
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
-    async def wait_for_model_loading(self, model_name, max_retries=30, retry_delay=5):
-        """모델이 완전히 로드될 때까지 기다립니다."""
+    async def wait_for_model_loading(self, model_name, max_retries=30, retry_delay=5, initial_delay=0.2):
+        """
+        모델이 완전히 로드될 때까지 기다립니다.
+        확인 간격은 initial_delay부터 1.5배씩 늘어나 retry_delay까지 증가하며,
+        전체 대기 시간은 max_retries * retry_delay 초로 제한됩니다.
+        """
         logger.info(f"모델 '{model_name}' 로드 대기 중...")
         print(f"모델 '{model_name}' 로드 대기 중...")
         
         start_time = time.time()
+        deadline = time.monotonic() + max_retries * retry_delay
+        delay = initial_delay
+        attempt = 0
         model_loaded = False
         
-        for attempt in range(max_retries):
+        while True:
+            attempt += 1
             try:
                 # 모델이 사용 가능한지 확인
                 if await self.check_model_availability(model_name):
@@ -172,12 +235,19 @@ class OllamaManager:
                 # 아직 로드되지 않음
                 elapsed = time.time() - start_time
                 elapsed_str = f"{int(elapsed // 60)}분 {int(elapsed % 60)}초"
-                print(f"\r모델 로드 대기 중... (경과: {elapsed_str}) {attempt+1}/{max_retries}", end="")
-                await asyncio.sleep(retry_delay)
+                print(f"\r모델 로드 대기 중... (경과: {elapsed_str}) 시도 {attempt}", end="")
                 
             except Exception as e:
-                logger.warning(f"모델 로드 확인 실패, 재시도 {attempt+1}/{max_retries}: {str(e)}")
-                await asyncio.sleep(retry_delay)
+                logger.warning(f"모델 로드 확인 실패, 재시도 {attempt}: {str(e)}")
+            
+            # 제한 시간 확인 후 점점 긴 간격으로 대기
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if await self._cancellable_sleep(min(delay, remaining)):
+                logger.info("모델 로드 대기 작업이 취소되었습니다.")
+                break
+            delay = min(delay * 1.5, retry_delay)
         
         print()  # 줄바꿈
         
@@ -194,32 +264,34 @@ class OllamaManager:
         
         return True
 
-    async def ping_model(self, model_name, interval=60):
-        """모델이 VRAM에서 제거되지 않도록 주기적으로 핑을 보냅니다."""
+    async def pin_model(self, model_name):
+        """
+        keep_alive를 지정하여 모델을 VRAM에 고정합니다.
+        빈 프롬프트 요청은 토큰을 생성하지 않고 모델 로드와 유지 시간만 갱신합니다.
+        """
+        keep_alive = keep_alive_value(settings.OLLAMA_KEEP_ALIVE)
+        await self.client.generate(model=model_name, prompt="", keep_alive=keep_alive)
+        logger.info(f"모델 '{model_name}' 메모리 유지 설정 (keep_alive: {keep_alive})")
+
+    async def ping_model(self, model_name, interval=600):
+        """
+        모델이 VRAM에서 제거되지 않았는지 주기적으로 확인합니다.
+        모든 chat 요청에 같은 keep_alive를 지정하여 모델을 고정하므로 핑은 Ollama 재시작 등에 대비한 감시 용도입니다.
+        """
         logger.info(f"모델 '{model_name}' 핑 시작 (간격: {interval}초)")
         
         try:
             while not self._shutdown_event.is_set():
+                # shutdown_event를 감지하면서 대기
+                if await self._cancellable_sleep(interval):
+                    break
+                
                 try:
-                    # 가벼운 쿼리 실행
-                    test_response = await self.client.generate(
-                        model=model_name,
-                        prompt="ping",
-                        options={"num_predict": 1}  # 최소한의 토큰만 생성
-                    )
+                    # 모델 고정 요청 재전송 (토큰 생성 없음)
+                    await self.pin_model(model_name)
                     logger.debug(f"모델 '{model_name}' 핑 성공")
                 except Exception as e:
                     logger.warning(f"모델 '{model_name}' 핑 실패: {str(e)}")
-                
-                # wait_for을 사용하여 shutdown_event를 감지하면서 대기
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(), 
-                        timeout=interval
-                    )
-                except asyncio.TimeoutError:
-                    # 타임아웃은 정상적인 상황이므로 무시
-                    pass
         except asyncio.CancelledError:
             logger.info(f"모델 '{model_name}' 핑 작업이 취소되었습니다.")
         except Exception as e:
@@ -227,7 +299,7 @@ class OllamaManager:
         finally:
             logger.info(f"모델 '{model_name}' 핑 작업 종료")
 
-    async def load(self, model_name: str, max_retries=1, retry_delay=1, keep_alive=False, ping_interval=60):
+    async def load(self, model_name: str, max_retries=1, retry_delay=1, keep_alive=False, ping_interval=None):
         """Ollama 모델을 다운로드하고 로드합니다. 선택적으로 핑을 유지합니다."""
         model = model_name or self.model
         logger.debug(f"OLLAMA 호스트: {settings.OLLAMA_BASE_URL}, 모델 로드: {model}")
@@ -247,10 +319,12 @@ class OllamaManager:
         # 2. 모델 로드 대기
         await self.wait_for_model_loading(model, max_retries, retry_delay)
         
-        # 3. 필요한 경우 핑 작업 시작
+        # 3. 필요한 경우 모델을 메모리에 고정하고 감시 핑 작업 시작
         if keep_alive:
+            await self.pin_model(model)
+            
             # 백그라운드 태스크로 핑 시작
-            self.ping_task = asyncio.create_task(self.ping_model(model, ping_interval))
+            self.ping_task = asyncio.create_task(self.ping_model(model, ping_interval or settings.OLLAMA_PING_INTERVAL))
             logger.info(f"모델 '{model}' 핑 작업이 백그라운드에서 실행 중입니다.")
         
         return None
@@ -0,0 +1,126 @@
+"""
+의미 기반 번역 캐시 (app/modules/semantic_cache.py)
+
+- Ollama 임베딩 API로 원문을 벡터로 변환
+- 언어 쌍별로 최근 번역의 임베딩을 보관하고 코사인 유사도가 기준 이상이면 이전 번역을 재사용
+"""
+import re
+import math
+import logging
+import operator
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.modules.llm import ollamac
+from app.settings import settings, SRC_LOG_LEVELS
+
+logger = logging.getLogger(__name__)
+logger.setLevel(SRC_LOG_LEVELS["MODULE"])
+
+# 숫자가 다른 문장은 의미가 비슷해도 번역이 달라야 하므로 숫자 비교에 사용
+_DIGITS_RE = re.compile(r'\d+')
+
+# (정규화된 임베딩, 원문의 숫자 목록, 원문, 번역)
+_Entry = Tuple[List[float], List[str], str, str]
+
+def _normalize(vector: List[float]) -> Optional[List[float]]:
+    """벡터를 단위 길이로 정규화합니다. 길이가 0이면 None을 반환합니다."""
+    norm = math.sqrt(sum(map(operator.mul, vector, vector)))
+    if norm == 0:
+        return None
+    return [v / norm for v in vector]
+
+class SemanticCache:
+    """
+    임베딩 유사도 기반 번역 캐시
+
+    정확히 같은 텍스트만 찾는 번역 캐시를 보완하여, 공백이나 문장 부호 정도만 다른
+    텍스트는 LLM 호출 없이 이전 번역을 사용합니다.
+    """
+
+    def __init__(self,
+                 model: str = settings.SEMANTIC_CACHE_MODEL,
+                 threshold: float = settings.SEMANTIC_CACHE_THRESHOLD,
+                 max_size: int = settings.SEMANTIC_CACHE_SIZE ):
+        """
+        의미 기반 캐시 초기화
+
+        Args:
+            model (str, 선택): 임베딩에 사용할 Ollama 모델 이름
+            threshold (float, 선택): 이전 번역을 재사용할 최소 코사인 유사도
+            max_size (int, 선택): 언어 쌍별 최대 보관 항목 수 (오래된 항목부터 제거)
+        """
+        self.model = model
+        self.threshold = threshold
+        self.max_size = max_size
+        self._entries: Dict[Tuple[str, str], Deque[_Entry]] = {}
+
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """
+        텍스트의 정규화된 임베딩을 반환합니다. 실패하면 None을 반환합니다.
+
+        Args:
+            text: 임베딩할 텍스트
+
+        Returns:
+            Optional[List[float]]: 단위 길이 임베딩
+        """
+        try:
+            response = await ollamac.get_client().embed(model=self.model, input=text)
+            return _normalize(response["embeddings"][0])
+        except Exception as e:
+            # 캐시 오류로 번역이 실패하지 않도록 무시
+            logger.debug("임베딩 생성 실패: %s", e)
+            return None
+
+    async def lookup(self, source_lang: str, target_lang: str, text: str) -> Tuple[Optional[str], Optional[List[float]]]:
+        """
+        의미가 거의 같은 이전 번역을 찾습니다.
+
+        Args:
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            text: 번역할 텍스트
+
+        Returns:
+            Tuple[Optional[str], Optional[List[float]]]: (찾은 번역, 텍스트 임베딩). 임베딩은 add에 다시 사용합니다.
+        """
+        vector = await self.embed(text)
+        if vector is None:
+            return None, None
+
+        digits = _DIGITS_RE.findall(text)
+        best_score = self.threshold
+        best_translation = None
+        for cached_vector, cached_digits, _, translation in self._entries.get((source_lang, target_lang), ()):
+            if cached_digits != digits:
+                continue
+            score = sum(map(operator.mul, vector, cached_vector))
+            if score >= best_score:
+                best_score = score
+                best_translation = translation
+
+        if best_translation is not None:
+            logger.debug("의미 캐시 적중: '%s' (유사도 %.3f)", text, best_score)
+        return best_translation, vector
+
+    def add(self, source_lang: str, target_lang: str, text: str, translation: str, vector: Optional[List[float]]) -> None:
+        """
+        번역 결과를 캐시에 추가합니다.
+
+        Args:
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            text: 원본 텍스트
+            translation: 번역된 텍스트
+            vector: lookup에서 받은 텍스트 임베딩
+        """
+        if vector is None:
+            return
+
+        entries = self._entries.get((source_lang, target_lang))
+        if entries is None:
+            entries = self._entries[(source_lang, target_lang)] = deque(maxlen=self.max_size)
+        entries.append((vector, _DIGITS_RE.findall(text), text, translation))
+
+SEMANTIC_CACHE = SemanticCache()
@@ -9,6 +9,7 @@ import logging
 
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import PlainTextResponse
+from app.models.translation import TranslateBatchRequest, TranslateBatchResponse
 from app.services.consistent_translator import ConsistentTranslator
 from app.settings import settings
 from app.settings import SRC_LOG_LEVELS
@@ -18,6 +19,14 @@ logger.setLevel(SRC_LOG_LEVELS["ROUTER"])
 
 router = APIRouter()
 
+def _check_target_language(to: str) -> None:
+    """지원되는 대상 언어인지 확인합니다."""
+    if to not in settings.SUPPORTED_LANGUAGES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원되지 않는 대상 언어: {to}. 지원되는 언어: {', '.join(sorted(settings.SUPPORTED_LANGUAGES))}"
+        )
+
 @router.get("/translate", response_class=PlainTextResponse)
 async def translate_get(
     from_lang: str = Query(None, alias="from", description="원본 언어 코드"),
@@ -33,11 +42,7 @@ async def translate_get(
     """
     logger.debug(f"원본 언어: {from_lang}, 대상 언어: {to}, 텍스트: {text}")
     # 지원되는 언어인지 확인
-    if to not in settings.SUPPORTED_LANGUAGES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"지원되지 않는 대상 언어: {to}. 지원되는 언어: {', '.join(settings.SUPPORTED_LANGUAGES)}"
-        )
+    _check_target_language(to)
     
     # 일관성 보장 번역 적용
     translated_text = await ConsistentTranslator.translate(
@@ -48,3 +53,25 @@ async def translate_get(
     logger.debug(f"번역 결과: {translated_text}")
     # PlainTextResponse로 직접 텍스트 반환 (따옴표 없음)
     return translated_text
+
+@router.post("/translate_batch", response_model=TranslateBatchResponse)
+async def translate_batch(request: TranslateBatchRequest):
+    """
+    여러 텍스트를 한 번에 지정된 언어로 번역합니다.
+    짧은 텍스트를 연달아 번역하는 경우 묶어서 LLM에 전달하므로 요청별 오버헤드가 줄어듭니다.
+    번역 결과는 /translate와 같은 캐시를 사용하며, 번역 품질 평가가 켜져 있으면 텍스트별로 번역하여 평가를 적용합니다.
+    
+    - **from**: 원본 텍스트의 언어 코드
+    - **to**: 번역할 대상 언어 코드
+    - **texts**: 번역할 텍스트 목록 (최대 100개)
+    """
+    logger.debug(f"원본 언어: {request.from_lang}, 대상 언어: {request.to}, 텍스트 수: {len(request.texts)}")
+    # 지원되는 언어인지 확인
+    _check_target_language(request.to)
+    
+    translations = await ConsistentTranslator.translate_batch(
+        texts=request.texts,
+        source_lang=request.from_lang,
+        target_lang=request.to
+    )
+    return TranslateBatchResponse(translations=translations)
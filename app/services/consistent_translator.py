@@ -4,21 +4,34 @@
 - 사용자 사전을 참조 프롬프트로 제공하도록 개선
 - 긴 문장을 직접 대체하지 않고 LLM에 정보 제공
 """
+import asyncio
 import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from app.services.dictionary_manager import DICTIONARY
-from app.services.translate_service import translate_text
-from app.models.llm import SystemPrompt
+from app.modules.logging import TranslationLogger
+from app.services.translate_service import translate_text, translate_batch, lookup_translation
+from app.models.llm import build_system_prompt, build_batch_system_prompt
 
-from app.settings import SRC_LOG_LEVELS
+from app.settings import settings, SRC_LOG_LEVELS
 
 logger = logging.getLogger(__name__)
 logger.setLevel(SRC_LOG_LEVELS["SERVICE"])
 
+# 한 번의 LLM 요청으로 번역할 최대 텍스트 수
+BATCH_CHUNK_SIZE = 20
+
+# 번역 결과 캐시 최대 항목 수
+CACHE_MAX_SIZE = 10_000
+
 class ConsistentTranslator:
     """
     언어 일관성을 보장하는 번역 서비스
     """
+    # 번역 결과 LRU 캐시 ((원본 언어, 대상 언어, 텍스트) -> (사전 버전, 번역))
+    _cache: "OrderedDict[Tuple[str, str, str], Tuple[int, str]]" = OrderedDict()
+
     @classmethod
     async def translate(
         cls,
@@ -48,8 +61,95 @@ class ConsistentTranslator:
         if not text or text.strip() == "":
             return ""
 
+        cached = cls._get_cached(text, source_lang, target_lang)
+        if cached is not None:
+            return cached
+
+        translated_text = await cls._translate(text, source_lang, target_lang)
+        cls._set_cached(text, source_lang, target_lang, translated_text)
+
+        return translated_text
+
+    @classmethod
+    def _get_cached(cls, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        캐시된 번역을 반환합니다. 사전이 변경된 뒤에는 이전 번역을 사용하지 않습니다.
+        
+        Args:
+            text: 번역할 텍스트
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            
+        Returns:
+            Optional[str]: 캐시된 번역, 없으면 None
+        """
+        if not settings.ENABLE_CACHE:
+            return None
+        
+        key = (source_lang, target_lang, text)
+        cached = cls._cache.get(key)
+        if cached is None or cached[0] != DICTIONARY.get_version(target_lang):
+            return None
+        
+        cls._cache.move_to_end(key)
+        TranslationLogger.log_translation(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            source_text=text,
+            translated_text=f"{cached[1]} (cache)"
+        )
+        return cached[1]
+
+    @classmethod
+    def _set_cached(cls, text: str, source_lang: str, target_lang: str, translated_text: str) -> None:
+        """
+        번역 결과를 현재 사전 버전과 함께 캐시에 저장합니다. (가장 오래 사용하지 않은 항목부터 제거)
+        
+        Args:
+            text: 원본 텍스트
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            translated_text: 번역된 텍스트
+        """
+        if not settings.ENABLE_CACHE:
+            return
+        
+        key = (source_lang, target_lang, text)
+        cls._cache[key] = (DICTIONARY.get_version(target_lang), translated_text)
+        cls._cache.move_to_end(key)
+        if len(cls._cache) > CACHE_MAX_SIZE:
+            cls._cache.popitem(last=False)
+
+    @classmethod
+    async def _translate(
+        cls,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> str:
+        """
+        캐시에 없는 텍스트를 사전 참조 정보와 함께 번역합니다.
+        
+        Args:
+            text: 번역할 텍스트
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            
+        Returns:
+            str: 번역된 텍스트
+        """
         # logger.debug(f"사전 참조 번역 요청: {text} (from {source_lang} to {target_lang})")
-        # 사전에서 참조 정보 가져오기
+        # 사전에서 참조 정보 가져오기 (사전이 로드되지 않았으면 비동기로 로드)
+        await DICTIONARY.load_dictionary(target_lang)
+        
+        # 사전으로 직접 번역되는 짧은 문장은 참조 정보 없이 바로 처리
+        if settings.ENABLE_DICTIONARY and DICTIONARY.get_translation(text, target_lang) is not None:
+            return await translate_text(
+                text=text,
+                source_lang=source_lang,
+                target_lang=target_lang
+            )
+        
         references = DICTIONARY.get_prompt_references(text, target_lang)
         
         # 참조 정보가 없으면 기본 번역 사용
@@ -61,21 +161,16 @@ class ConsistentTranslator:
                 target_lang=target_lang
             )
     
-        # 프롬프트 생성
-        prompt = SystemPrompt(source_lang=source_lang, target_lang=target_lang)\
-            .CRITICAL()\
-            .WORD_MAPPING()\
-            .RESPONSE_FORMAT()
-
         logger.debug(f"사전 참조 정보")
-        # 참조 정보 추가        
-        for i, ref in enumerate(references):
-            prompt.CUSTOM(
-                f"- \"{ref['term']}\" -> \"{ref['translation']}\"\n"
-            )
+        for ref in references:
             logger.debug(f"- \"{ref['term']}\" -> \"{ref['translation']}\"")
-            
-        system_prompt = prompt.RESPONSE_FORMAT().build()
+
+        # 프롬프트 생성 (동일한 참조 조합은 캐시된 프롬프트 재사용)
+        system_prompt = build_system_prompt(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            references=references
+        )
 
         return await translate_text(
             text=text,
@@ -83,4 +178,114 @@ class ConsistentTranslator:
             target_lang=target_lang,
             system_prompt=system_prompt
         )
-        
\ No newline at end of file
+        
+
+    @classmethod
+    async def translate_batch(
+        cls,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> List[str]:
+        """
+        여러 텍스트를 사전 참조 정보와 함께 묶어서 번역합니다.
+        캐시나 사전으로 번역되지 않는 텍스트만 모아 BATCH_CHUNK_SIZE개씩 한 번의 LLM 요청으로 번역하며,
+        응답이 올바르지 않은 묶음은 텍스트별로 다시 번역합니다.
+        번역 품질 평가(ENABLE_EVALUATION)가 켜져 있으면 묶지 않고 텍스트별로 번역하여 평가를 적용합니다.
+        
+        Args:
+            texts: 번역할 텍스트 목록
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            
+        Returns:
+            List[str]: 입력 순서대로 번역된 텍스트 목록
+        """
+        # init
+        if not source_lang:
+            raise Exception("source_lang is required")
+        
+        if source_lang == target_lang:
+            return list(texts)
+        
+        await DICTIONARY.load_dictionary(target_lang)
+        
+        # 캐시나 사전에서 바로 찾을 수 있는 텍스트 처리
+        results = [""] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if not text or text.strip() == "":
+                continue
+            if text in pending:
+                pending[text].append(i)
+                continue
+            known_translation = cls._get_cached(text, source_lang, target_lang)
+            if known_translation is None:
+                known_translation = await lookup_translation(source_lang, target_lang, text)
+            if known_translation is not None:
+                results[i] = known_translation
+            else:
+                pending[text] = [i]
+        
+        pending_texts = list(pending)
+        chunks = [pending_texts[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(pending_texts), BATCH_CHUNK_SIZE)]
+        translated_chunks = await asyncio.gather(*(
+            cls._translate_chunk(chunk, source_lang, target_lang) for chunk in chunks
+        ))
+        
+        for chunk, translations in zip(chunks, translated_chunks):
+            for text, translated_text in zip(chunk, translations):
+                cls._set_cached(text, source_lang, target_lang, translated_text)
+                for i in pending[text]:
+                    results[i] = translated_text
+        
+        return results
+
+    @classmethod
+    async def _translate_chunk(
+        cls,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> List[str]:
+        """
+        텍스트 묶음을 하나의 프롬프트로 번역합니다.
+        텍스트가 하나뿐이거나 번역 품질 평가가 켜져 있으면 텍스트별 일반 번역을 사용합니다.
+        
+        Args:
+            texts: 번역할 텍스트 목록
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            
+        Returns:
+            List[str]: 입력 순서대로 번역된 텍스트 목록
+        """
+        if len(texts) > 1 and not settings.ENABLE_EVALUATION:
+            # 묶음 전체의 참조 정보 합집합 (중복 용어 제외)
+            references = []
+            seen = set()
+            for text in texts:
+                for ref in DICTIONARY.get_prompt_references(text, target_lang):
+                    if ref["term"] not in seen:
+                        seen.add(ref["term"])
+                        references.append(ref)
+            
+            system_prompt = build_batch_system_prompt(
+                source_lang=source_lang,
+                target_lang=target_lang,
+                references=references
+            )
+            translations = await translate_batch(
+                source_lang=source_lang,
+                target_lang=target_lang,
+                texts=texts,
+                system_prompt=system_prompt
+            )
+            if translations is not None:
+                return translations
+            
+            logger.debug("일괄 번역 응답이 올바르지 않아 개별 번역으로 처리합니다.")
+        
+        return await asyncio.gather(*(
+            cls.translate(text=text, source_lang=source_lang, target_lang=target_lang) for text in texts
+        ))
@@ -7,9 +7,13 @@
 
 import os
 import re
-import json
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Pattern, Set, Tuple
+
+import aiofiles
+import ahocorasick
+import orjson
 
 from app.models.llm import WordMapping 
 from app.settings import settings, DICTIONARIES_PATH
@@ -18,23 +22,88 @@ from app.settings import SRC_LOG_LEVELS
 logger = logging.getLogger(__name__)
 logger.setLevel(SRC_LOG_LEVELS["SERVICE"])
 
+# 사전 파일 직렬화 옵션 (들여쓰기 2칸, 유니코드 문자 그대로 저장)
+_DUMPS_OPTION = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def _dumps(dictionary: Dict[str, Dict[str, str]]) -> bytes:
+    """사전을 파일에 저장할 UTF-8 JSON 바이트로 직렬화합니다."""
+    return orjson.dumps(dictionary, option=_DUMPS_OPTION)
+
+def _write_file(filepath: str, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체하여, 쓰기 도중 중단되어도 기존 사전 파일이 손상되지 않도록 저장합니다."""
+    temp_file = f"{filepath}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+    os.replace(temp_file, filepath)
+
+def _is_word_char(char: str) -> bool:
+    """정규식 \\w와 같은 기준으로 단어 문자인지 확인합니다."""
+    return char.isalnum() or char == "_"
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """정규식 \\b와 같은 기준으로 index 위치가 단어 경계인지 확인합니다."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+class _TermIndex(NamedTuple):
+    """언어별 사전 용어 색인"""
+    # 케이스폴딩한 용어 -> [(카테고리 우선순위, 원본 용어, 번역)] (우선순위 순)
+    exact: Dict[str, List[Tuple[int, str, str]]]
+    # 부분 치환 대상 케이스폴딩한 용어 -> 번역 (우선순위가 가장 높은 카테고리 기준)
+    partial: Dict[str, str]
+    # 부분 치환용 패턴 (긴 용어 우선, 단어 경계 확인). 대상 용어가 없으면 None
+    pattern: Optional[Pattern]
+
 class DictionaryManager:
     """
     동적 사용자 정의 단어 사전 관리 클래스
     """
-    # 기본 사전 저장 경로
-    _base_path = DICTIONARIES_PATH
-    
-    # 사전 캐시
-    _dictionaries = {}
-    
     # 커스텀 항목 우선 순위 카테고리
     _priority_categories = ["character_names", "place_names", "custom_terms", "ui", "general"]
     
     # 직접 대체 최대 길이 (이보다 긴 문장은 참조용으로만 사용)
     MAX_DIRECT_REPLACEMENT_LENGTH = 30
     
-    def initialize_dictionaries(self) -> None:
+    # 사전 파일 저장 지연 시간 (초). 이 시간 동안의 변경 사항을 한 번에 저장
+    FLUSH_DELAY = 0.5
+    
+    def __init__(self, base_path: str = DICTIONARIES_PATH):
+        """
+        사전 관리자 초기화. 사전과 캐시는 인스턴스마다 따로 관리합니다.
+        
+        Args:
+            base_path: 사전 파일 저장 경로
+        """
+        # 사전 저장 경로
+        self._base_path = base_path
+        
+        # 사전 캐시
+        self._dictionaries: Dict[str, Dict[str, Dict[str, str]]] = {}
+        
+        # 용어 색인 캐시 (언어 코드 -> 색인)
+        self._indexed: Dict[str, _TermIndex] = {}
+        
+        # 참조 정보/용어 매핑 검색용 Aho-Corasick 오토마톤 캐시 (언어 코드 -> 오토마톤, 모든 카테고리 대상)
+        self._automata: Dict[str, "ahocorasick.Automaton"] = {}
+        
+        # 항목이 있는 우선순위 카테고리 캐시 (언어 코드 -> [(우선순위, 카테고리, 용어)])
+        self._ordered_cats: Dict[str, List[Tuple[int, str, Dict[str, str]]]] = {}
+        
+        # 사전 변경 버전 (언어 코드 -> 버전). 사전 내용이 바뀔 때마다 증가
+        self._versions: Dict[str, int] = {}
+        
+        # 저장 대기 중인 언어 코드와 저장 작업 (지연 시간 동안 대기 중인 작업만 보관)
+        self._dirty: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # 파일 저장 잠금 (예약된 저장과 종료 시 저장이 같은 파일을 동시에 쓰지 않도록 함)
+        self._flush_lock = asyncio.Lock()
+        
+        # 언어별 사전 로드 잠금 (동시 첫 접근 시 중복 로드 방지)
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    async def initialize_dictionaries(self) -> None:
         """
         애플리케이션 시작 시 모든 지원 언어에 대한 사전을 미리 로드합니다.
         이 메서드는 애플리케이션 시작 시 한 번 호출되어야 합니다.
@@ -47,17 +116,51 @@ class DictionaryManager:
             os.makedirs(self._base_path, exist_ok=True)
             logger.info(f"사전 디렉토리 생성: {self._base_path}")
         
-        # 지원되는 모든 언어의 사전 파일 확인 및 로드
-        for lang in settings.SUPPORTED_LANGUAGES:
-            filepath = os.path.join(self._base_path, f"{lang}_dictionary.json")
-            
-            # 파일이 존재하는지 확인
-            if os.path.exists(filepath):
-                # 사전 로드
-                self.get_dictionary(lang)
+        # 지원되는 모든 언어의 사전을 미리 로드 (요청 처리 중에는 메모리 조회만 수행)
+        await asyncio.gather(*(self.load_dictionary(lang) for lang in settings.SUPPORTED_LANGUAGES))
         
         logger.info(f"사전 초기화 완료: {len(self._dictionaries)}개 언어 로드됨")
     
+    async def load_dictionary(self, lang_code: str) -> Dict[str, Dict[str, str]]:
+        """
+        지정된 언어 코드에 대한 단어 사전을 비동기로 로드합니다.
+        이미 로드된 사전이 있으면 파일 I/O 없이 바로 반환합니다.
+        
+        Args:
+            lang_code: 언어 코드 (예: "ko", "ja", "en")
+            
+        Returns:
+            Dict[str, Dict[str, str]]: 카테고리별 단어 사전
+        """
+        dictionary = self._dictionaries.get(lang_code)
+        if dictionary is not None:
+            return dictionary
+        
+        lock = self._locks.setdefault(lang_code, asyncio.Lock())
+        async with lock:
+            # 잠금을 기다리는 동안 다른 요청이 로드했을 수 있음
+            dictionary = self._dictionaries.get(lang_code)
+            if dictionary is not None:
+                return dictionary
+            
+            filepath = os.path.join(self._base_path, f"{lang_code}_dictionary.json")
+            
+            # 파일이 없으면 기본 사전 생성
+            if not await asyncio.to_thread(os.path.exists, filepath):
+                await asyncio.to_thread(self._create_default_dictionary, lang_code)
+            
+            try:
+                async with aiofiles.open(filepath, 'rb') as f:
+                    data = await f.read()
+                translations = orjson.loads(data)
+            except Exception as e:
+                logger.error(f"사전 파일 로드 오류: {filepath}, {str(e)}")
+                return {}
+            
+            self._dictionaries[lang_code] = translations
+            logger.info(f"사전 로드 완료: {lang_code}, 항목 수: {sum(len(v) for v in translations.values())}")
+            return translations
+    
     def _create_default_dictionary(self, lang_code: str) -> None:
         """
         언어 코드에 대한 기본 사전 파일을 생성합니다.
@@ -76,16 +179,16 @@ class DictionaryManager:
         # 파일에 저장
         filepath = os.path.join(self._base_path, f"{lang_code}_dictionary.json")
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(base_dict, f, ensure_ascii=False, indent=2)
-                logger.info(f"기본 사전 파일 생성: {filepath}")
+            _write_file(filepath, _dumps(base_dict))
+            logger.info(f"기본 사전 파일 생성: {filepath}")
         except Exception as e:
             logger.error(f"사전 파일 저장 오류: {filepath}, {str(e)}")
     
     def get_dictionary(self, lang_code: str) -> Dict[str, Dict[str, str]]:
         """
         지정된 언어 코드에 대한 단어 사전을 가져옵니다.
-        사전이 아직 로드되지 않았으면 로드합니다.
+        사전이 아직 로드되지 않았으면 동기적으로 로드합니다.
+        (비동기 코드에서는 load_dictionary로 먼저 로드해 두어야 이벤트 루프를 막지 않습니다)
         
         Args:
             lang_code: 언어 코드 (예: "ko", "ja", "en")
@@ -107,8 +210,8 @@ class DictionaryManager:
         
         # 파일에서 사전 로드
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                translations = json.load(f)
+            with open(filepath, 'rb') as f:
+                translations = orjson.loads(f.read())
                 self._dictionaries[lang_code] = translations
                 
                 logger.info(f"사전 로드 완료: {lang_code}, 항목 수: {sum(len(v) for v in translations.values())}")
@@ -117,6 +220,112 @@ class DictionaryManager:
             logger.error(f"사전 파일 로드 오류: {filepath}, {str(e)}")
             return self._dictionaries[lang_code]
     
+    def _ordered_categories(self, lang_code: str) -> List[Tuple[int, str, Dict[str, str]]]:
+        """
+        우선순위 카테고리 중 사전에 항목이 있는 카테고리만 우선순위 순서로 반환합니다.
+        사전이 변경되기 전까지 결과를 재사용합니다.
+        
+        Args:
+            lang_code: 언어 코드
+            
+        Returns:
+            List[Tuple[int, str, Dict[str, str]]]: (카테고리 우선순위, 카테고리, 용어 사전) 목록
+        """
+        ordered = self._ordered_cats.get(lang_code)
+        if ordered is not None:
+            return ordered
+        
+        dictionary = self.get_dictionary(lang_code) or {}
+        ordered = [
+            (rank, category, dictionary[category])
+            for rank, category in enumerate(self._priority_categories)
+            if dictionary.get(category)
+        ]
+        self._ordered_cats[lang_code] = ordered
+        return ordered
+    
+    def _get_index(self, lang_code: str) -> _TermIndex:
+        """
+        사전 용어 색인을 반환합니다.
+        모든 카테고리의 용어를 우선순위와 길이 순으로 미리 정리하여 사전이 변경되기 전까지 재사용합니다.
+        
+        Args:
+            lang_code: 언어 코드
+            
+        Returns:
+            _TermIndex: 용어 색인
+        """
+        index = self._indexed.get(lang_code)
+        if index is not None:
+            return index
+        
+        # 대소문자 비교는 casefold 기준 (예: "STRASSE"와 "Straße"를 같은 용어로 취급)
+        exact: Dict[str, List[Tuple[int, str, str]]] = {}
+        partial: Dict[str, str] = {}
+        partial_sources: List[str] = []
+        for rank, _, terms in self._ordered_categories(lang_code):
+            for source, translation in terms.items():
+                key = source.casefold()
+                exact.setdefault(key, []).append((rank, source, translation))
+                
+                # 최소 길이 제한 (너무 짧은 단어는 제외)
+                if len(source) > 2 and key not in partial:
+                    partial[key] = translation
+                    partial_sources.append(source)
+        
+        # 긴 용어가 먼저 매치되도록 정렬하여 하나의 패턴으로 결합 (단어 경계 확인)
+        pattern = None
+        if partial_sources:
+            sources = sorted(partial_sources, key=len, reverse=True)
+            pattern = re.compile(r'\b(' + '|'.join(re.escape(source) for source in sources) + r')\b', re.IGNORECASE)
+        
+        index = _TermIndex(exact, partial, pattern)
+        self._indexed[lang_code] = index
+        return index
+    
+    def _get_automaton(self, lang_code: str) -> "ahocorasick.Automaton":
+        """
+        사전의 모든 카테고리 용어(소문자)를 담은 Aho-Corasick 오토마톤을 반환합니다.
+        각 용어의 값은 (소문자 용어 길이, [(카테고리 우선순위, 사전 순서, 카테고리, 원본 용어)]) 입니다.
+        우선순위 카테고리가 아니면 우선순위는 len(_priority_categories)입니다.
+        (소문자 변환으로 길이가 바뀌는 문자가 있으므로 원본 용어가 아닌 소문자 용어 길이를 사용)
+        
+        Args:
+            lang_code: 언어 코드
+            
+        Returns:
+            ahocorasick.Automaton: 용어 검색용 오토마톤
+        """
+        automaton = self._automata.get(lang_code)
+        if automaton is not None:
+            return automaton
+        
+        dictionary = self.get_dictionary(lang_code) or {}
+        ranks = {category: rank for rank, category in enumerate(self._priority_categories)}
+        other_rank = len(self._priority_categories)
+        
+        automaton = ahocorasick.Automaton()
+        order = 0
+        for category, terms in dictionary.items():
+            rank = ranks.get(category, other_rank)
+            for source in terms:
+                # 빈 문자열 건너뛰기
+                if not source.strip():
+                    continue
+                key = source.lower()
+                value = automaton.get(key, None)
+                if value is None:
+                    value = (len(key), [])
+                    automaton.add_word(key, value)
+                value[1].append((rank, order, category, source))
+                order += 1
+        
+        if len(automaton) > 0:
+            automaton.make_automaton()
+        
+        self._automata[lang_code] = automaton
+        return automaton
+    
     def get_translation(self, text: str, target_lang: str) -> Optional[str]:
         """
         특정 텍스트에 대한 번역을 사전에서 찾습니다.
@@ -143,60 +352,80 @@ class DictionaryManager:
         if not dictionary:
             return None
             
-        # 정확한 매치 확인
-        for category in self._priority_categories:
-            if category in dictionary:
-                if text in dictionary[category]:
-                    return dictionary[category][text]
-                    
-                # 대소문자 구분 없이 확인
-                text_lower = text.lower()
-                for source, translation in dictionary[category].items():
-                    if source.lower() == text_lower:
-                        return translation
+        index = self._get_index(target_lang)
+        
+        # 정확한 매치 확인 (우선순위가 가장 높은 카테고리에서 대소문자까지 일치하는 항목 우선)
+        entries = index.exact.get(text.casefold())
+        if entries:
+            top_rank = entries[0][0]
+            for rank, source, translation in entries:
+                if rank != top_rank:
+                    break
+                if source == text:
+                    return translation
+            return entries[0][2]
         
         # 부분 매치 (고유명사 등 포함된 경우)
-        result = text
-        replacements_made = False
-        original_words = text.split()
-        
-        # 우선순위가 높은 카테고리부터 처리
-        for category in self._priority_categories:
-            if category in dictionary:
-                for source, translation in dictionary[category].items():
-                    if len(source) > 2:  # 최소 길이 제한 (너무 짧은 단어는 제외)
-                        # 단어 경계 확인 (온전한 단어 대체)
-                        pattern = r'\b' + re.escape(source) + r'\b'
-                        if re.search(pattern, result, re.IGNORECASE):
-                            result = re.sub(pattern, translation, result, flags=re.IGNORECASE)
-                            replacements_made = True
-        
-        if replacements_made:
+        if index.pattern is None:
+            return None
+        
+        # 모든 카테고리의 용어를 긴 용어부터 한 번에 치환
+        result, count = index.pattern.subn(lambda match: index.partial.get(match.group(1).casefold(), match.group(0)), text)
+        
+        if count:
             # 혼합 언어 검사: 결과에 단어가 남아있는지 확인
-            # 1. 원문의 모든 단어가 번역되었는지 확인
-            result_words = result.split()
+            # 1. 결과 단어를 케이스폴딩한 집합으로 한 번만 정리
+            result_words = {word.casefold() for word in result.split()}
             
             # 2. 원문에 있는 영어 단어가 결과에도 그대로 있는지 확인 (대소문자 무시)
-            contains_untranslated = False
-            for orig_word in original_words:
-                # 단순 구두점이나 숫자는 건너뛰기
-                if len(orig_word) <= 1 or orig_word.isdigit():
+            for orig_word in text.split():
+                # 한 글자 단어는 건너뛰고, 영어 알파벳으로만 구성된 단어만 확인
+                if len(orig_word) <= 1 or not (orig_word.isascii() and orig_word.isalpha()):
                     continue
-                    
-                # 영어 알파벳으로만 구성된 단어가 결과에 그대로 남아있는지 확인
-                if re.match(r'^[a-zA-Z]+$', orig_word):
-                    if any(res_word.lower() == orig_word.lower() for res_word in result_words):
-                        contains_untranslated = True
-                        break
-            
-            # 3. 번역되지 않은 단어가 있다면 부분 번역 결과를 사용하지 않음
-            if contains_untranslated:
-                return None
+                
+                # 3. 번역되지 않은 단어가 있다면 부분 번역 결과를 사용하지 않음
+                if orig_word.casefold() in result_words:
+                    return None
                 
             return result
             
         return None
     
+    def get_term_mappings(self, text: str, target_lang: str) -> Dict[str, str]:
+        """
+        텍스트에 공백으로 구분된 단어나 구문으로 포함된 사전 용어를 모든 카테고리에서 찾습니다.
+        (UI 요소, 버튼 등 알려진 용어를 프롬프트에 추가할 때 사용)
+        
+        Args:
+            text: 번역할 텍스트
+            target_lang: 대상 언어 코드
+            
+        Returns:
+            Dict[str, str]: 원본 용어 -> 번역 (사전 순서)
+        """
+        if not text:
+            return {}
+        
+        dictionary = self.get_dictionary(target_lang)
+        automaton = self._get_automaton(target_lang)
+        if automaton.kind != ahocorasick.AHOCORASICK:
+            return {}
+        
+        # 대소문자 구분 없이 텍스트를 한 번만 훑어서 검색 (앞뒤가 공백이거나 텍스트 경계인 경우만)
+        text_lower = text.lower()
+        last = len(text_lower) - 1
+        found = []
+        for end, (length, entries) in automaton.iter(text_lower):
+            start = end - length + 1
+            if (start == 0 or text_lower[start - 1] == " ") and (end == last or text_lower[end + 1] == " "):
+                found.extend(entries)
+        
+        # 사전 순서대로 정리 (같은 용어가 여러 카테고리에 있으면 마지막 카테고리의 번역 사용)
+        mappings = {}
+        for _, _, category, source in sorted(found, key=lambda entry: entry[1]):
+            mappings[source] = dictionary[category][source]
+        return mappings
+    
     def get_prompt_references(self, text: str, target_lang: str) -> List[Dict[str, str]]:
         """
         텍스트에 포함된 용어들의 사전 참조 정보를 가져옵니다.
@@ -217,21 +446,28 @@ class DictionaryManager:
         if not dictionary:
             return []
             
-        references = []
+        automaton = self._get_automaton(target_lang)
+        if automaton.kind != ahocorasick.AHOCORASICK:
+            return []
         
-        # 텍스트에서 사전 용어 찾기
-        for category in self._priority_categories:
-            if category in dictionary:
-                for source, translation in dictionary[category].items():
-                    if len(source) > 2:  # 최소 길이 제한
-                        # 단어 경계 또는 공백 확인
-                        pattern = r'\b' + re.escape(source) + r'\b'
-                        if re.search(pattern, text, re.IGNORECASE) or f" {source} " in f" {text} ":
-                            references.append({
-                                "term": source,
-                                "translation": translation
-                            })
+        # 텍스트를 한 번만 훑어서 사전 용어 찾기 (단어 경계 확인, 우선순위 카테고리의 3자 이상 용어만 사용)
+        text_lower = text.lower()
+        other_rank = len(self._priority_categories)
+        found = set()
+        for end, (length, entries) in automaton.iter(text_lower):
+            start = end - length + 1
+            if _is_word_boundary(text_lower, start) and _is_word_boundary(text_lower, end + 1):
+                found.update(entry for entry in entries if entry[0] < other_rank and len(entry[3]) > 2)
         
+        # 카테고리 우선순위와 사전 순서대로 정렬 (대소문자만 다른 중복 용어는 우선순위가 높은 항목만 사용)
+        references = []
+        seen = set()
+        for _, _, category, source in sorted(found):
+            key = source.casefold()
+            if key in seen:
+                continue
+            seen.add(key)
+            references.append({"term": source, "translation": dictionary[category][source]})
         return references
     
     def process_word_mapping(self, word_mapping: List[WordMapping], target_lang: str) -> None:
@@ -242,6 +478,7 @@ class DictionaryManager:
             word_mapping: LLM에서 반환한 단어 매핑 딕셔너리
             target_lang: 대상 언어 코드
         """
+        items = []
         for item in word_mapping:
 
             category: str = item["category"]
@@ -253,18 +490,14 @@ class DictionaryManager:
                 category = "custom_terms"  # 기본값
 
             # 단어 후처리
-            category = category.strip()
-            original = original.strip()
-            translated = translated.strip()
-                
-            # 번역 사전에 추가
-            self.add_translation(
-                text=original,
-                translation=translated,
-                target_lang=target_lang,
-                category=category,
-                confidence=0.9  # LLM의 번역은 신뢰도가 높다고 가정
-            )
+            items.append((original.strip(), translated.strip(), category.strip()))
+        
+        # 번역 사전에 한 번에 추가 (파일 저장도 한 번만 수행)
+        self.add_translations(
+            items=items,
+            target_lang=target_lang,
+            confidence=0.9  # LLM의 번역은 신뢰도가 높다고 가정
+        )
 
 
     def add_translation(self, text: str, translation: str, target_lang: str, category: str = "custom_terms", confidence: float = 0.8) -> bool:
@@ -281,21 +514,52 @@ class DictionaryManager:
         Returns:
             bool: 성공 여부
         """
+        return self.add_translations([(text, translation, category)], target_lang, confidence) > 0
+    
+    def _is_valid_entry(self, text: str, translation: str) -> bool:
+        """
+        사전에 추가할 수 있는 항목인지 확인합니다.
+        
+        Args:
+            text: 원본 텍스트
+            translation: 번역된 텍스트
+            
+        Returns:
+            bool: 추가 가능 여부
+        """
         # 빈 텍스트 처리
         if not text or not text.strip() or not translation or not translation.strip():
             return False
             
-        # 신뢰도가 낮으면 무시
-        if confidence < 0.5:
-            return False
-            
         # 너무 긴 텍스트는 사전에 추가하지 않음
         if len(text) > self.MAX_DIRECT_REPLACEMENT_LENGTH:
             return False
             
         # 숫자나 특수문자만 있는 경우 제외
-        if re.match(r'^[\d\W]+$', text):
+        if not any(_is_word_char(char) and not char.isdecimal() for char in text):
             return False
+        
+        return True
+    
+    def add_translations(self, items: List[Tuple[str, str, str]], target_lang: str, confidence: float = 0.8) -> int:
+        """
+        번역 사전에 여러 항목을 추가하고 파일에 한 번만 저장합니다.
+        
+        Args:
+            items: (원본 텍스트, 번역된 텍스트, 카테고리) 목록
+            target_lang: 대상 언어 코드
+            confidence: 신뢰도 점수 (0.0~1.0)
+            
+        Returns:
+            int: 추가된 항목 수 (저장 실패 시 0)
+        """
+        # 신뢰도가 낮으면 무시
+        if confidence < 0.5:
+            return 0
+        
+        entries = [(text, translation, category) for text, translation, category in items if self._is_valid_entry(text, translation)]
+        if not entries:
+            return 0
             
         # 사전 가져오기 (없으면 생성)
         if target_lang not in self._dictionaries:
@@ -303,25 +567,113 @@ class DictionaryManager:
         
         dictionary = self._dictionaries[target_lang]
         
-        # 카테고리 확인 (없으면 생성)
-        if category not in dictionary:
-            dictionary[category] = {}
+        changed = False
+        for text, translation, category in entries:
+            # 카테고리 확인 (없으면 생성) 후 번역 추가 (이미 같은 번역이 있으면 건너뛰기)
+            terms = dictionary.setdefault(category, {})
+            if terms.get(text) == translation:
+                continue
+            terms[text] = translation
+            changed = True
+            logger.info(f"사전에 단어 추가: {text} -> {translation} ({category})")
         
-        # 번역 추가
-        dictionary[category][text] = translation
+        if not changed:
+            return len(entries)
         
-        # 파일에 저장
-        filepath = os.path.join(self._base_path, f"{target_lang}_dictionary.json")
+        self._invalidate(target_lang)
+        
+        # 파일 저장 예약 (짧은 시간 동안의 변경 사항을 모아서 저장)
+        return len(entries) if self._schedule_flush(target_lang) else 0
+    
+    def get_version(self, lang_code: str) -> int:
+        """
+        사전 변경 버전을 반환합니다. 사전 내용에 따라 만든 결과가 아직 유효한지 확인할 때 사용합니다.
+        
+        Args:
+            lang_code: 언어 코드
+            
+        Returns:
+            int: 사전 변경 버전
+        """
+        return self._versions.get(lang_code, 0)
+    
+    def _invalidate(self, lang_code: str) -> None:
+        """사전 내용이 바뀌었을 때 용어 색인을 지우고 버전을 올립니다."""
+        self._ordered_cats.pop(lang_code, None)
+        self._indexed.pop(lang_code, None)
+        self._automata.pop(lang_code, None)
+        self._versions[lang_code] = self._versions.get(lang_code, 0) + 1
+    
+    def _schedule_flush(self, lang_code: str) -> bool:
+        """
+        사전 파일 저장을 예약합니다. 실행 중인 이벤트 루프가 없으면 즉시 저장합니다.
+        
+        Args:
+            lang_code: 언어 코드
+            
+        Returns:
+            bool: 성공 여부
+        """
+        self._dirty.add(lang_code)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(dictionary, f, ensure_ascii=False, indent=2)
-            logger.info(f"사전에 단어 추가: {text} -> {translation} ({category})")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._save_dictionary(lang_code)
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+        return True
+    
+    def _save_dictionary(self, lang_code: str) -> bool:
+        """
+        사전을 파일에 동기적으로 저장합니다.
+        
+        Args:
+            lang_code: 언어 코드
+            
+        Returns:
+            bool: 성공 여부
+        """
+        self._dirty.discard(lang_code)
+        filepath = os.path.join(self._base_path, f"{lang_code}_dictionary.json")
+        
+        try:
+            _write_file(filepath, _dumps(self._dictionaries.get(lang_code, {})))
             return True
         except Exception as e:
             logger.error(f"사전 파일 저장 오류: {filepath}, {str(e)}")
             return False
     
+    async def _flush_later(self) -> None:
+        """지연 시간 후 변경된 사전을 저장합니다."""
+        await asyncio.sleep(self.FLUSH_DELAY)
+        # 저장을 시작한 뒤에는 flush()에서 취소하지 않도록 예약 작업에서 제외
+        self._flush_task = None
+        await self.flush()
+    
+    async def flush(self) -> None:
+        """
+        변경된 모든 사전을 파일에 저장합니다.
+        직렬화는 이벤트 루프에서 한 번에 끝내므로 도중에 사전이 변경되지 않으며, 파일 쓰기만 별도 스레드에서 수행합니다.
+        """
+        # 아직 대기 중인 저장 예약은 취소하고 여기서 함께 저장
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        
+        async with self._flush_lock:
+            while self._dirty:
+                lang_code = self._dirty.pop()
+                filepath = os.path.join(self._base_path, f"{lang_code}_dictionary.json")
+                
+                try:
+                    data = _dumps(self._dictionaries.get(lang_code, {}))
+                    await asyncio.to_thread(_write_file, filepath, data)
+                    logger.debug(f"사전 파일 저장: {filepath}")
+                except Exception as e:
+                    logger.error(f"사전 파일 저장 오류: {filepath}, {str(e)}")
+    
     def reload_dictionary(self, lang_code: str) -> bool:
         """
         특정 언어의 사전을 다시 로드합니다.
@@ -335,6 +687,7 @@ class DictionaryManager:
         # 캐시에서 제거
         if lang_code in self._dictionaries:
             del self._dictionaries[lang_code]
+        self._invalidate(lang_code)
         
         # 다시 로드
         dictionary = self.get_dictionary(lang_code)
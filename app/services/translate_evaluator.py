@@ -7,53 +7,61 @@
 3. 반복 학습형 피드백 시스템
 """
 import json
-import re
+import asyncio
 import logging
-from typing import Dict, Any, Tuple, List
+from collections import OrderedDict
+from typing import Dict, Any, Tuple, List, Optional
 
 from app.modules.llm import ollamac
-from app.models.llm import Message
 from app.models.llm import EvaluationReseponse
-from app.models.llm import TranslateReseponse
+from app.models.llm import ImproveReseponse
 from app.models.llm import SystemPrompt
 from app.models.llm import ImprovePrompt
 
 from app.modules.logging import TranslationLogger
+from app.utils.async_utils import run_once
 from app.utils.language_utils import get_language_name
-from app.utils.string_utils import parse_llm_json_response
+from app.utils.string_utils import clean_special_chars, parse_llm_json_response
 from app.settings import SRC_LOG_LEVELS, settings
 
 logger = logging.getLogger(__name__)
 logger.setLevel(SRC_LOG_LEVELS["SERVICE"])
 
+# 평가 프롬프트에 남길 특수문자 (마침표, 쉼표, 느낌표, 물음표). 그 외 특수문자는 공백으로 치환
+_ALLOWED_SPECIAL_CHARS = ''.join(['.', ',', '!', '?'])
+# 평가 이력을 보관할 최대 원본 텍스트 수 (가장 오래 사용하지 않은 텍스트부터 제거)
+EVALUATION_HISTORY_MAX_SIZE = 10_000
+
+def _unique_history(evaluation_history: List[Dict[str, Any]], fields: Tuple[str, ...], exclude: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+    """
+    프롬프트에 넣을 평가 이력에서 같은 내용의 항목을 한 번만 남깁니다. (마지막 항목 유지, 순서 유지)
+
+    Args:
+        evaluation_history: 평가 이력 리스트
+        fields: 중복 판단에 사용할 필드
+        exclude: 프롬프트의 다른 부분에 이미 포함된 번역 (해당 translated_text 항목 제외)
+
+    Returns:
+        List[Dict[str, Any]]: 중복이 제거된 평가 이력
+    """
+    seen = set()
+    unique = []
+    for item in reversed(evaluation_history):
+        if item.get('translated_text') in exclude:
+            continue
+        key = tuple(item.get(field) for field in fields)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(item)
+    unique.reverse()
+    return unique
+
 class TranslationEvaluator:
     # 평가 이력을 저장하기 위한 클래스 변수
-    _evaluation_history = {}  # 키: source_text, 값: [평가 이력 리스트]
-    
-    def clean_special_chars(self, text: str) -> str:
-        """
-        LLM에 전달하기 전에 허용된 특수문자만 남기고 제거합니다.
-        
-        Args:
-            text: 처리할 텍스트
-            
-        Returns:
-            str: 특수문자가 제거된 텍스트
-        """
-        if not text:
-            return ""
-        
-        # 허용할 특수문자 목록: 마침표, 쉼표, 느낌표, 물음표, 싱글쿼터, 괄호, 기타 문장 부호
-        allowed_special_chars = ['.', ',', '!', '?' ]
-        
-        # 정규식을 사용하여 허용된 특수문자와 일반 문자(알파벳, 숫자, 공백)만 유지
-        pattern = r'[^\w\s' + re.escape(''.join(allowed_special_chars)) + ']'
-        cleaned_text = re.sub(pattern, ' ', text)
-        
-        # 연속된 공백을 하나로 치환
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
-        
-        return cleaned_text
+    _evaluation_history: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()  # 키: source_text, 값: [평가 이력 리스트] (LRU)
+    # 진행 중인 평가 (키: (원본, 번역, 원본 언어, 대상 언어)). 같은 평가는 결과를 공유
+    _in_flight: Dict[Tuple[str, str, str, str], asyncio.Task] = {}
     
     def store_evaluation_history(self, source_text: str, evaluation: Dict[str, Any]) -> None:
         """
@@ -63,14 +71,22 @@ class TranslationEvaluator:
             source_text: 원본 텍스트
             evaluation: 평가 정보 (점수, 피드백 등)
         """
-        if source_text not in TranslationEvaluator._evaluation_history:
-            TranslationEvaluator._evaluation_history[source_text] = []
+        history = TranslationEvaluator._evaluation_history
+        items = history.get(source_text)
+        if items is None:
+            items = history[source_text] = []
+        else:
+            history.move_to_end(source_text)
         
         # 최대 5개까지만 저장
-        if len(TranslationEvaluator._evaluation_history[source_text]) >= 5:
-            TranslationEvaluator._evaluation_history[source_text].pop(0)
+        if len(items) >= 5:
+            items.pop(0)
         
-        TranslationEvaluator._evaluation_history[source_text].append(evaluation)
+        items.append(evaluation)
+        
+        # 보관 텍스트 수 제한 (가장 오래 사용하지 않은 항목 제거)
+        if len(history) > EVALUATION_HISTORY_MAX_SIZE:
+            history.popitem(last=False)
     
     def get_evaluation_history(self, source_text: str) -> List[Dict[str, Any]]:
         """
@@ -82,7 +98,13 @@ class TranslationEvaluator:
         Returns:
             List[Dict[str, Any]]: 평가 이력 리스트
         """
-        return TranslationEvaluator._evaluation_history.get(source_text, [])
+        history = TranslationEvaluator._evaluation_history
+        items = history.get(source_text)
+        if items is None:
+            return []
+        
+        history.move_to_end(source_text)
+        return items
     
     async def evaluate_translation(
         self, 
@@ -111,17 +133,44 @@ class TranslationEvaluator:
         if source_text == translated_text:
             return 100, "번역이 필요 없는 텍스트"
         
-        # 평가 이력 가져오기
-        evaluation_history = self.get_evaluation_history(source_text)
+        # 같은 평가가 이미 진행 중이면 LLM을 다시 호출하지 않고 그 결과를 기다림
+        return await run_once(
+            TranslationEvaluator._in_flight,
+            (source_text, translated_text, source_lang, target_lang),
+            lambda: self._evaluate_translation(source_text, translated_text, source_lang, target_lang)
+        )
+
+    async def _evaluate_translation(
+        self, 
+        source_text: str, 
+        translated_text: str, 
+        source_lang: str, 
+        target_lang: str
+    ) -> Tuple[int, str]:
+        """
+        LLM으로 번역 품질을 평가합니다.
+        
+        Args:
+            source_text: 원본 텍스트
+            translated_text: 번역된 텍스트
+            source_lang: 원본 언어 코드
+            target_lang: 대상 언어 코드
+            
+        Returns:
+            Tuple[int, str]: (품질 점수 0-100, 평가 설명)
+        """
+        # 평가 이력 가져오기 (같은 점수/피드백은 한 번만 포함)
+        evaluation_history = _unique_history(self.get_evaluation_history(source_text), ('score', 'feedback'))
         
         prompt = ImprovePrompt(source_lang=source_lang, target_lang=target_lang)
 
         # 이전 평가 이력이 있으면 프롬프트에 추가
         if evaluation_history:
-            history_text = "\n\nPrevious evaluation history:\n"
-            for i, eval_item in enumerate(evaluation_history):
-                history_text += f"{i+1}. Score: {eval_item.get('score', 'N/A')}, "
-                history_text += f"Feedback: {eval_item.get('feedback', 'N/A')}\n"
+            history_text = "\n\nPrevious evaluation history:\n" + "".join(
+                f"{i}. Score: {eval_item.get('score', 'N/A')}, "
+                f"Feedback: {eval_item.get('feedback', 'N/A')}\n"
+                for i, eval_item in enumerate(evaluation_history, 1)
+            )
             # system_prompt += history_text
             prompt.CUSTOM(history_text)
 
@@ -136,13 +185,14 @@ Translation ({normalize_target_lang}): {translated_text}
 Evaluate this translation and provide a score and brief feedback in JSON format."""
 
         try:
-            messages = []
-            messages.append(  Message( role="system", content=system_prompt ) )
-            messages.append(  Message( role="user", content=user_prompt ) )
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
 
             response = await ollamac.chat(
                 messages=messages,
-                format=EvaluationReseponse.model_json_schema(),
+                format=EvaluationReseponse,
                 timeout=settings.OLLAMA_TIMEOUT,
             )
             # logger.debug(f"Evaluation response: {response}")
@@ -195,9 +245,9 @@ Evaluate this translation and provide a score and brief feedback in JSON format.
         target_lang: str,
         feedback: str,
         word_mapping: Dict[str, str]
-    ) -> str:
+    ) -> Tuple[str, Any, Optional[int], Optional[str]]:
         """
-        이전 번역을 개선합니다.
+        이전 번역을 개선하고, 같은 요청에서 개선된 번역의 점수와 피드백을 함께 받습니다.
         
         Args:
             source_text: 원본 텍스트
@@ -207,29 +257,34 @@ Evaluate this translation and provide a score and brief feedback in JSON format.
             feedback: 이전 번역에 대한 피드백
             
         Returns:
-            str: 개선된 번역
+            Tuple[str, Any, Optional[int], Optional[str]]: (개선된 번역, 단어 매핑, 점수, 피드백). 점수를 받지 못하면 점수와 피드백은 None
         """
         # 특수문자 제거
-        cleaned_source_text = self.clean_special_chars(source_text)
-        cleaned_previous_translation = self.clean_special_chars(previous_translation)
-        cleaned_feedback = self.clean_special_chars(feedback)
+        cleaned_source_text = clean_special_chars(source_text, _ALLOWED_SPECIAL_CHARS)
+        cleaned_previous_translation = clean_special_chars(previous_translation, _ALLOWED_SPECIAL_CHARS)
+        cleaned_feedback = clean_special_chars(feedback, _ALLOWED_SPECIAL_CHARS)
         
-        # 평가 이력 가져오기
-        evaluation_history = self.get_evaluation_history(source_text)
+        # 평가 이력 가져오기 (같은 번역은 한 번만 포함하고, 사용자 프롬프트에 있는 이전 번역은 제외)
+        evaluation_history = _unique_history(
+            self.get_evaluation_history(source_text),
+            ('translated_text',),
+            exclude=(previous_translation,)
+        )
 
         # 번역 프롬프트 구성
         prompt = SystemPrompt(source_lang=source_lang, target_lang=target_lang)\
                 .CRITICAL()\
                 .WORD_MAPPING()\
-                .RESPONSE_FORMAT()
+                .IMPROVE_RESPONSE_FORMAT()
 
         # 이전 평가 이력이 있으면 프롬프트에 추가
         if evaluation_history:
-            history_text = "\n\nPrevious translation attempts:\n"
-            for i, eval_item in enumerate(evaluation_history):
-                history_text += f"{i+1}. Translation: {eval_item.get('translated_text', 'N/A')}\n"
-                history_text += f"   Score: {eval_item.get('score', 'N/A')}, "
-                history_text += f"Feedback: {eval_item.get('feedback', 'N/A')}\n"
+            history_text = "\n\nPrevious translation attempts:\n" + "".join(
+                f"{i}. Translation: {eval_item.get('translated_text', 'N/A')}\n"
+                f"   Score: {eval_item.get('score', 'N/A')}, "
+                f"Feedback: {eval_item.get('feedback', 'N/A')}\n"
+                for i, eval_item in enumerate(evaluation_history, 1)
+            )
             prompt.CUSTOM(history_text)
 
         system_prompt = prompt.build()
@@ -241,16 +296,17 @@ Evaluate this translation and provide a score and brief feedback in JSON format.
 Previous Translation ({nomalize_target_lang}): {cleaned_previous_translation}
 Feedback: {cleaned_feedback}
 
-Provide an improved translation."""
+Provide an improved translation AND rate it 0-100 with brief feedback."""
         
         try:
-            messages = []
-            messages.append(  Message( role="system", content=system_prompt ) )
-            messages.append(  Message( role="user", content=user_prompt ) )
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
 
             response = await ollamac.chat(
                 messages=messages,
-                format=TranslateReseponse.model_json_schema(),
+                format=ImproveReseponse,
                 timeout=settings.OLLAMA_TIMEOUT,
             )
             
@@ -265,18 +321,32 @@ Provide an improved translation."""
                 
                 # 결과가 없는 경우 원래 번역 반환
                 if not improved_translation:
-                    return previous_translation, None
+                    return previous_translation, None, None, None
+                
+                # 자체 평가 점수 (없거나 숫자가 아니면 None)
+                try:
+                    score = max(0, min(int(evaluation.get("score")), 100))
+                except (TypeError, ValueError):
+                    return improved_translation, word_mapping, None, None
+                
+                feedback = evaluation.get("feedback", "평가 정보 없음")
+                
+                # 평가 이력 저장
+                self.store_evaluation_history(
+                    source_text, 
+                    {"score": score, "feedback": feedback, "translated_text": improved_translation}
+                )
                 
-                return improved_translation, word_mapping
+                return improved_translation, word_mapping, score, feedback
                 
             except (json.JSONDecodeError, ValueError):
                 # JSON 파싱 실패 시 원래 응답 텍스트를 사용
                 # 따옴표 제거 등 후처리
                 improved_translation = content.strip()
                 if not improved_translation:
-                    return previous_translation
+                    return previous_translation, word_mapping, None, None
                 
-                return improved_translation, word_mapping
+                return improved_translation, word_mapping, None, None
                 
         except Exception as e:
             # 예외 발생 시 원래 번역 반환
@@ -286,6 +356,6 @@ Provide an improved translation."""
                 "target_lang": target_lang,
                 "text": source_text
             })
-            return previous_translation, word_mapping
+            return previous_translation, word_mapping, None, None
         
 EVALUATOR = TranslationEvaluator()
\ No newline at end of file
@@ -1,63 +1,198 @@
-import json
 import os
+import asyncio
+import logging
+from collections import OrderedDict
 from datetime import datetime
+from typing import List, Optional, Tuple
 
-from app.settings import settings, HISTORY_FILE
+import orjson
+
+from app.settings import HISTORY_FILE, SRC_LOG_LEVELS
+
+logger = logging.getLogger(__name__)
+logger.setLevel(SRC_LOG_LEVELS["SERVICE"])
+
+# 이전 버전의 JSON 이력 파일 (JSONL 파일이 없을 때 한 번 읽어서 변환)
+_LEGACY_HISTORY_FILE = os.path.splitext(HISTORY_FILE)[0] + ".json"
+
+# 이 횟수만큼 이력을 추가하면 파일을 현재 상태로 다시 작성 (중복/초과 항목 정리)
+COMPACT_INTERVAL = 1000
+
+# 파일 쓰기 작업 종류 (추가 / 전체 다시 작성)
+_APPEND = "append"
+_COMPACT = "compact"
+
+def _dumps(record: dict) -> bytes:
+    """이력 항목을 JSONL 한 줄(UTF-8 바이트)로 직렬화합니다."""
+    return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
 
 # 번역 이력 관리를 위한 클래스
 class TranslationHistory:
-    _history = {}  # 언어 쌍별 이력 저장 (source_lang:target_lang -> [번역 이력])
+    _history = {}  # 언어 쌍별 이력 저장 (source_lang:target_lang -> OrderedDict[원본 텍스트, 번역 이력])
     _history_file = HISTORY_FILE
     _max_history_per_lang_pair = 10
-    
+    _appends = 0  # 마지막 정리 이후 파일에 추가한 항목 수
+    # 기록 대기 중인 파일 쓰기 작업 큐. None은 종료 신호
+    _queue: asyncio.Queue = asyncio.Queue()
+    _writer_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start(cls) -> None:
+        """백그라운드 이력 기록 작업을 시작합니다."""
+        if cls._writer_task is None or cls._writer_task.done():
+            cls._writer_task = asyncio.create_task(cls._history_writer())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """남은 이력을 모두 기록한 뒤 백그라운드 작업을 종료합니다."""
+        if cls._writer_task is None:
+            return
+
+        cls._queue.put_nowait(None)
+        try:
+            await cls._writer_task
+        finally:
+            cls._writer_task = None
+
+    @classmethod
+    async def _history_writer(cls) -> None:
+        """큐에 쌓인 쓰기 작업을 모아 별도 스레드에서 기록합니다."""
+        running = True
+        while running:
+            item = await cls._queue.get()
+            if item is None:
+                break
+
+            # 이미 쌓여 있는 작업은 한 번에 기록
+            batch = [item]
+            while not cls._queue.empty():
+                item = cls._queue.get_nowait()
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+
+            await asyncio.to_thread(cls._write, cls._history_file, batch)
+
+    @staticmethod
+    def _write(history_file: str, batch: List[Tuple[str, bytes]]) -> None:
+        """쓰기 작업을 순서대로 파일에 반영합니다."""
+        appends: List[bytes] = []
+
+        def flush_appends():
+            if appends:
+                with open(history_file, 'ab') as f:
+                    f.write(b"".join(appends))
+                appends.clear()
+
+        try:
+            for op, data in batch:
+                if op == _APPEND:
+                    appends.append(data)
+                    continue
+
+                # 전체 다시 작성 전에 앞선 추가 작업을 먼저 반영
+                flush_appends()
+                temp_file = f"{history_file}.tmp"
+                with open(temp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_file, history_file)
+            flush_appends()
+        except Exception as e:
+            logger.error("번역 이력 저장 실패: %s", e)
+
+    def _enqueue(self, op: str, data: bytes):
+        """쓰기 작업을 기록 큐에 추가합니다. 작업이 없으면 즉시 기록합니다."""
+        if self._writer_task is not None and not self._writer_task.done():
+            self._queue.put_nowait((op, data))
+            return
+
+        self._write(self._history_file, [(op, data)])
+
     def initialize(self):
-        """번역 이력을 파일에서 로드합니다."""
-        if os.path.exists(self._history_file):
-            try:
-                with open(self._history_file, 'r', encoding='utf-8') as f:
-                    self._history = json.load(f)
-            except Exception as e:
-                print(f"번역 이력 로드 실패: {str(e)}")
-                self._history = {}
-    
-    def add_history(self, source_lang: str, target_lang: str, source_text: str, translated_text: str, 
+        """번역 이력을 파일에서 로드하고 파일을 정리합니다."""
+        self._history = {}
+        try:
+            if os.path.exists(self._history_file):
+                with open(self._history_file, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue  # 비정상 종료로 잘린 줄은 무시
+                        key = record.pop('key', None)
+                        if key:
+                            self._append(key, record)
+            elif os.path.exists(_LEGACY_HISTORY_FILE):
+                with open(_LEGACY_HISTORY_FILE, 'rb') as f:
+                    for key, items in orjson.loads(f.read()).items():
+                        for item in items:
+                            self._append(key, item)
+            else:
+                return
+        except Exception as e:
+            logger.error("번역 이력 로드 실패: %s", e)
+            self._history = {}
+            return
+
+        self._compact()
+
+    def _append(self, key: str, entry: dict):
+        """메모리 이력에 항목을 추가합니다. (같은 원본 텍스트는 교체, 최대 개수 유지)"""
+        items = self._history.get(key)
+        if items is None:
+            items = self._history[key] = OrderedDict()
+
+        # 중복 제거 (동일한 원본 텍스트가 있으면 제거 후 맨 뒤에 추가)
+        source_text = entry.get('source_text')
+        items.pop(source_text, None)
+        items[source_text] = entry
+
+        # 최대 개수 유지 (가장 오래된 항목부터 제거)
+        while len(items) > self._max_history_per_lang_pair:
+            items.popitem(last=False)
+
+    def add_history(self, source_lang: str, target_lang: str, source_text: str, translated_text: str,
                     quality_score: int = None, feedback: str = None):
         """번역 이력을 추가합니다."""
         key = f"{source_lang}:{target_lang}"
-        
-        if key not in self._history:
-            self._history[key] = []
-        
-        # 중복 제거 (동일한 원본 텍스트가 있으면 제거)
-        self._history[key] = [item for item in self._history[key] if item.get('source_text') != source_text]
-        
+
         # 새 이력 추가 (피드백 정보도 포함)
-        self._history[key].append({
+        entry = {
             'source_text': source_text,
             'translated_text': translated_text,
             'quality_score': quality_score,
             'feedback': feedback,  # 피드백 정보 추가
             'timestamp': datetime.now().isoformat()
-        })
-        
-        # 최대 개수 유지
-        if len(self._history[key]) > self._max_history_per_lang_pair:
-            self._history[key] = self._history[key][-self._max_history_per_lang_pair:]
-        
-        # 파일에 저장
-        self._save_history()
-    
+        }
+        self._append(key, entry)
+
+        # 파일에는 새 항목만 추가하고, 일정 횟수마다 전체를 다시 작성
+        self._appends += 1
+        if self._appends >= COMPACT_INTERVAL:
+            self._compact()
+        else:
+            self._save_entry(key, entry)
+
     def get_history(self, source_lang: str, target_lang: str) -> list:
         """특정 언어 쌍에 대한 번역 이력을 반환합니다."""
         key = f"{source_lang}:{target_lang}"
-        return self._history.get(key, [])
-    
-    def _save_history(self):
-        """번역 이력을 파일에 저장합니다."""
-        try:
-            with open(self._history_file, 'w', encoding='utf-8') as f:
-                json.dump(self._history, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"번역 이력 저장 실패: {str(e)}")
+        items = self._history.get(key)
+        return list(items.values()) if items else []
+
+    def _save_entry(self, key: str, entry: dict):
+        """번역 이력 항목 하나를 파일 끝에 추가합니다."""
+        self._enqueue(_APPEND, _dumps({'key': key, **entry}))
+
+    def _compact(self):
+        """현재 메모리 이력으로 파일을 다시 작성합니다. (내용은 호출 시점의 이력)"""
+        self._appends = 0
+        self._enqueue(_COMPACT, b"".join(
+            _dumps({'key': key, **item})
+            for key, items in self._history.items()
+            for item in items.values()
+        ))
 
-HISTORY = TranslationHistory()
\ No newline at end of file
+HISTORY = TranslationHistory()
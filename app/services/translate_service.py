@@ -13,20 +13,26 @@ import json
 import re
 import asyncio
 import logging
-from typing import List
+import functools
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from fastapi import HTTPException
 
+import orjson
+
 from app.modules.llm import ollamac
-from app.models.llm import Message
 from app.models.llm import TranslateReseponse
-from app.models.llm import SystemPrompt
+from app.models.llm import BatchTranslateReseponse
+from app.models.llm import build_system_prompt
 from app.models.llm import WordMapping
 
 from app.modules.logging import TranslationLogger
+from app.modules.semantic_cache import SEMANTIC_CACHE
 from app.services.dictionary_manager import DICTIONARY
 from app.services.translate_history import HISTORY
 from app.services.translate_evaluator import EVALUATOR
-from app.utils.string_utils import parse_llm_json_response
+from app.utils.async_utils import run_once
+from app.utils.string_utils import clean_special_chars, parse_llm_json_response
 
 from app.settings import settings
 from app.settings import SRC_LOG_LEVELS
@@ -35,57 +41,77 @@ from app.settings import SRC_LOG_LEVELS
 logger = logging.getLogger(__name__)
 logger.setLevel(SRC_LOG_LEVELS["SERVICE"])
 
-# 간단한 인메모리 캐시 시스템
-translation_cache = {}
+# 간단한 인메모리 LRU 캐시 시스템
+translation_cache: "OrderedDict[str, str]" = OrderedDict()
+TRANSLATION_CACHE_MAX_SIZE = 1000
+
+# 진행 중인 LLM 번역 (키: (캐시 키, 시스템 프롬프트)). 같은 요청은 결과를 공유
+_in_flight: Dict[Tuple[str, Optional[str]], asyncio.Task] = {}
+
+# LLM에 전달할 때 보존할 특수문자 (그 외 특수문자는 공백으로 치환)
+_ALLOWED_SPECIAL_CHARS = ''.join(['!', '?', '.', ',', '\'', '"'])
+
+# 스트리밍 응답의 첫 번째 키와 값의 첫 문자 (최상위 객체의 첫 키가 translation인 경우만 미리 반환)
+_FIRST_KEY_RE = re.compile(r'\s*\{\s*"((?:[^"\\]|\\.)*)"\s*:\s*(\S)')
 
-def clean_special_chars(text: str) -> str:
+# 응답을 반환한 뒤에도 계속 수신 중인 스트리밍 작업 (가비지 컬렉션 방지)
+_background_tasks: set = set()
+
+def _is_trivially_fine(text: str, translated_text: str) -> bool:
     """
-    LLM에 전달하기 전에 특수문자를 처리합니다.
-    마침표, 쉼표, 따옴표 등 문장 부호는 보존합니다.
+    LLM 평가 없이도 결과가 명확한 번역인지 확인합니다.
+    (원문과 번역이 같거나, 원문에 번역할 문자 없이 숫자/기호만 있는 경우)
     
     Args:
-        text: 처리할 텍스트
-        
+        text: 원본 텍스트
+        translated_text: 번역된 텍스트
+    
     Returns:
-        str: 처리된 텍스트
+        bool: 평가를 생략해도 되면 True
     """
-    if not text:
-        return ""
-        
-    allowed_special_chars = ['!', '?', '.', ',', '\'', '"']
+    if not isinstance(translated_text, str):
+        return False
     
-    # 정규식을 사용하여 허용된 특수문자와 일반 문자(알파벳, 숫자, 공백)만 유지
-    pattern = r'[^\w\s' + re.escape(''.join(allowed_special_chars)) + ']'
-    cleaned_text = re.sub(pattern, ' ', text)
+    source = text.strip()
+    if source == translated_text.strip():
+        return True
     
-    # 연속된 공백을 하나로 치환
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+    return not any(c.isalpha() for c in source)
+
+def _cache_translation(cache_key: str, translated_text: str) -> None:
+    """
+    번역 결과를 캐시에 저장합니다.
     
-    return cleaned_text
+    Args:
+        cache_key: 캐시 키 ("원본 언어:대상 언어:텍스트")
+        translated_text: 번역된 텍스트
+    """
+    if not settings.ENABLE_CACHE:
+        return
+    
+    translation_cache[cache_key] = translated_text
+    translation_cache.move_to_end(cache_key)
+    
+    # 캐시 크기 제한 (가장 오래 사용하지 않은 항목 제거)
+    if len(translation_cache) > TRANSLATION_CACHE_MAX_SIZE:
+        translation_cache.popitem(last=False)
 
-async def translate_text(source_lang: str, target_lang: str, text: str, system_prompt:str = None) -> str:
+async def lookup_translation(source_lang: str, target_lang: str, text: str) -> Optional[str]:
     """
-    Ollama를 사용하여 텍스트를 번역합니다.
+    LLM을 호출하지 않고 캐시나 사전에서 번역 결과를 찾습니다.
     
     Args:
-        source_lang: 원본 언어 코드 (없으면 자동 감지)
+        source_lang: 원본 언어 코드
         target_lang: 대상 언어 코드
         text: 번역할 텍스트
     
     Returns:
-        str: 번역된 텍스트
+        Optional[str]: 찾은 번역 결과, 없으면 None
     """
-    # 초기화
-    if not source_lang:
-        source_lang = "auto"
-
-    # 빈 텍스트 처리
-    if not text or text.strip() == "":
-        return ""
-        
     # 캐시 확인
     cache_key = f"{source_lang}:{target_lang}:{text}"
     if settings.ENABLE_CACHE and cache_key in translation_cache:
+        translation_cache.move_to_end(cache_key)
         cached_result = translation_cache[cache_key]
         # 캐시된 결과를 로그에 기록 (캐시 히트 표시)
         TranslationLogger.log_translation(
@@ -98,6 +124,8 @@ async def translate_text(source_lang: str, target_lang: str, text: str, system_p
     
     # UI 번역 사전에서 먼저 확인 (전체 텍스트 일치)
     if settings.ENABLE_DICTIONARY:
+        # 사전이 로드되지 않았으면 비동기로 로드
+        await DICTIONARY.load_dictionary(target_lang)
         dictionary_translation = DICTIONARY.get_translation(text, target_lang)
         if dictionary_translation is not None:  # None이 아닌 경우만 처리
             # 사전에서 찾은 번역 결과를 로그에 기록
@@ -118,100 +146,234 @@ async def translate_text(source_lang: str, target_lang: str, text: str, system_p
             )
             
             # 캐시 저장
-            if settings.ENABLE_CACHE:
-                translation_cache[cache_key] = dictionary_translation
+            _cache_translation(cache_key, dictionary_translation)
             
             return dictionary_translation
     
-    # 알려진 용어 또는 구문 매핑을 찾아 프롬프트에 포함
-    dictionary_mappings = {}
-    found_terms = []
+    return None
+
+def _find_string_end(text: str, pos: int, start: int) -> Tuple[int, int]:
+    """
+    JSON 문자열 값의 닫는 따옴표를 찾습니다. 이전 검색이 끝난 위치부터 새로 받은 부분만 검색합니다.
     
-    if settings.ENABLE_DICTIONARY:
-                
-        # 사전 객체 가져오기
-        dictionary = DICTIONARY.get_dictionary(target_lang)
-        if dictionary:
-            # 알려진 용어 또는 구문 (UI 요소, 버튼 등)이 전체 텍스트에 포함되어 있는지 확인
-            for category, translations in dictionary.items():
-                for source_term, target_term in translations.items():
-                    # 빈 문자열 건너뛰기
-                    if not source_term.strip():
-                        continue
-                        
-                    # 대소문자 구분 없이 검색 (소문자로 통일)
-                    source_term_lower = source_term.lower()
-                    text_lower = text.lower()
-                    
-                    # 독립된 단어나 구문으로 존재하는지 확인 (단어 경계 확인)
-                    if (f" {source_term_lower} " in f" {text_lower} " or 
-                        text_lower == source_term_lower or
-                        text_lower.startswith(f"{source_term_lower} ") or
-                        text_lower.endswith(f" {source_term_lower}")):
-                        
-                        # 알려진 용어를 프롬프트에 추가할 매핑에 포함
-                        dictionary_mappings[source_term] = target_term
-                        found_terms.append(source_term)
-    
-    # 이전 번역 이력 가져오기
-    previous_translations = HISTORY.get_history(
-        source_lang=source_lang,
-        target_lang=target_lang
+    Args:
+        text: 지금까지 받은 응답 내용
+        pos: 검색을 시작할 위치
+        start: 문자열 값의 시작 위치 (여는 따옴표 다음)
+    
+    Returns:
+        Tuple[int, int]: (닫는 따옴표 위치 또는 -1, 다음 검색을 시작할 위치)
+    """
+    while True:
+        quote = text.find('"', pos)
+        if quote < 0:
+            return -1, len(text)
+        
+        # 앞의 백슬래시가 홀수 개면 이스케이프된 따옴표
+        i = quote - 1
+        while i >= start and text[i] == '\\':
+            i -= 1
+        if (quote - 1 - i) % 2 == 0:
+            return quote, quote
+        pos = quote + 1
+
+async def _stream_chat(messages: List[dict], translation_future: asyncio.Future) -> str:
+    """
+    번역 요청을 스트리밍으로 보내고, translation 필드가 완성되는 즉시 translation_future에 전달합니다.
+    
+    Args:
+        messages: 채팅 메시지 목록
+        translation_future: 완성된 번역을 전달받을 Future
+    
+    Returns:
+        str: 전체 응답 내용
+    """
+    contents = ""
+    value_start = None  # translation 값의 시작 위치 (-1: 미리 반환하지 않고 전체 응답을 파싱)
+    search_pos = 0
+    async for piece in ollamac.chat_stream(
+        messages=messages,
+        format=TranslateReseponse,
+        timeout=settings.OLLAMA_TIMEOUT
+    ):
+        contents += piece
+        if value_start == -1 or translation_future.done():
+            continue
+        
+        if value_start is None:
+            match = _FIRST_KEY_RE.match(contents)
+            if match is None:
+                continue
+            # word_mapping 안의 translation과 구분하기 위해 최상위 첫 번째 키만 사용
+            if match.group(1) != "translation" or match.group(2) != '"':
+                value_start = -1
+                continue
+            value_start = search_pos = match.end()
+        
+        end, search_pos = _find_string_end(contents, search_pos, value_start)
+        if end >= 0:
+            try:
+                translation_future.set_result(orjson.loads(f'"{contents[value_start:end]}"'))
+            except orjson.JSONDecodeError:
+                value_start = -1
+    return contents.strip()
+
+async def _stream_translation(messages: List[dict]) -> Tuple[Optional[str], Optional[str], Optional[asyncio.Task]]:
+    """
+    스트리밍으로 번역하고 translation 필드가 완성되면 나머지 응답을 기다리지 않고 반환합니다.
+    
+    Args:
+        messages: 채팅 메시지 목록
+    
+    Returns:
+        Tuple[Optional[str], Optional[str], Optional[asyncio.Task]]:
+            번역을 먼저 받은 경우 (None, 번역, 나머지를 수신 중인 작업),
+            그렇지 않으면 (전체 응답 내용, None, None)
+    """
+    translation_future = asyncio.get_running_loop().create_future()
+    stream_task = asyncio.create_task(_stream_chat(messages, translation_future))
+    await asyncio.wait((translation_future, stream_task), return_when=asyncio.FIRST_COMPLETED)
+    
+    if translation_future.done():
+        _background_tasks.add(stream_task)
+        stream_task.add_done_callback(_background_tasks.discard)
+        return None, translation_future.result(), stream_task
+    
+    # translation 필드를 찾지 못한 채 끝난 경우 (오류는 호출자에게 전달)
+    return stream_task.result(), None, None
+
+def _apply_streamed_word_mapping(target_lang: str, stream_task: asyncio.Task) -> None:
+    """스트리밍이 끝난 뒤 응답의 word_mapping을 사전에 반영합니다."""
+    try:
+        response_content = parse_llm_json_response(content=stream_task.result())
+        word_mapping = response_content.get("word_mapping", [])
+        logger.debug("사전 매핑 처리: %s", word_mapping)
+        DICTIONARY.process_word_mapping(word_mapping, target_lang)
+    except BaseException as e:
+        logger.debug("사전 매핑 처리 오류: %r", e)
+
+async def translate_text(source_lang: str, target_lang: str, text: str, system_prompt:str = None) -> str:
+    """
+    Ollama를 사용하여 텍스트를 번역합니다.
+    
+    Args:
+        source_lang: 원본 언어 코드 (없으면 자동 감지)
+        target_lang: 대상 언어 코드
+        text: 번역할 텍스트
+    
+    Returns:
+        str: 번역된 텍스트
+    """
+    # 초기화
+    if not source_lang:
+        source_lang = "auto"
+
+    # 빈 텍스트 처리
+    if not text or text.strip() == "":
+        return ""
+        
+    # 캐시 및 사전에서 먼저 확인
+    cache_key = f"{source_lang}:{target_lang}:{text}"
+    known_translation = await lookup_translation(source_lang, target_lang, text)
+    if known_translation is not None:
+        return known_translation
+    
+    # 같은 번역이 이미 진행 중이면 LLM을 다시 호출하지 않고 그 결과를 기다림
+    return await run_once(
+        _in_flight,
+        (cache_key, system_prompt),
+        lambda: _translate_uncached(source_lang, target_lang, text, cache_key, system_prompt)
     )
+
+async def _translate_uncached(source_lang: str, target_lang: str, text: str, cache_key: str, system_prompt: str = None) -> str:
+    """
+    캐시나 사전에 없는 텍스트를 LLM으로 번역합니다.
+    
+    Args:
+        source_lang: 원본 언어 코드
+        target_lang: 대상 언어 코드
+        text: 번역할 텍스트
+        cache_key: 번역 캐시 키
+        system_prompt: 시스템 프롬프트 (없으면 기본 프롬프트 구성)
     
+    Returns:
+        str: 번역된 텍스트
+    """
     # 특수문자 처리
-    cleaned_text = clean_special_chars(text)
+    cleaned_text = clean_special_chars(text, _ALLOWED_SPECIAL_CHARS)
     # cleaned_text = text
-
+    
+    # 의미가 거의 같은 이전 번역 확인 (임베딩은 번역 후 캐시에 추가할 때 재사용)
+    embedding = None
+    if settings.ENABLE_SEMANTIC_CACHE:
+        semantic_translation, embedding = await SEMANTIC_CACHE.lookup(source_lang, target_lang, cleaned_text)
+        if semantic_translation is not None:
+            TranslationLogger.log_translation(
+                source_lang=source_lang, 
+                target_lang=target_lang, 
+                source_text=text, 
+                translated_text=f"{semantic_translation} (semantic-cache)"
+            )
+            _cache_translation(cache_key, semantic_translation)
+            return semantic_translation
+    
     if system_prompt is None:
-        prompt = SystemPrompt(source_lang=source_lang, target_lang=target_lang)\
-                .CRITICAL()\
-                .WORD_MAPPING()\
-                .RESPONSE_FORMAT()
-
-        # 사전에서 발견된 용어 매핑이 있으면 프롬프트에 추가
-        if dictionary_mappings:
-            prompt.REFERENCES(references=dictionary_mappings)
-
-        # 이전 번역 이력이 있으면 프롬프트에 추가 (최대 5개)
-        if previous_translations:
-            history_prompt = "\nPREVIOUS TRANSLATIONS (for reference):\n"
-            for i, item in enumerate(previous_translations[-5:]):
-                history_prompt += f"{i+1}. Source: \"{item['source_text']}\"\n"
-                history_prompt += f"   Translation: \"{item['translated_text']}\"\n"
-            prompt.CUSTOM(history_prompt)
-
-        system_prompt = prompt.build()
+        # 이전 번역 이력 가져오기
+        previous_translations = HISTORY.get_history(
+            source_lang=source_lang,
+            target_lang=target_lang
+        )
+        
+        # 알려진 용어 또는 구문 (UI 요소, 버튼 등)이 텍스트에 포함되어 있으면 프롬프트에 포함
+        dictionary_mappings = {}
+        if settings.ENABLE_DICTIONARY:
+            dictionary_mappings = DICTIONARY.get_term_mappings(text, target_lang)
+        
+        # 기본 구성 프롬프트 (사전에서 발견된 용어 매핑과 이전 번역 이력(최대 5개)은 고정 부분 뒤에 참조 정보로 포함)
+        system_prompt = build_system_prompt(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            references=[{"term": term, "translation": translation} for term, translation in dictionary_mappings.items()],
+            history=previous_translations
+        )
         # logger.debug(f"시스템 프롬프트: {system_prompt}")
     
     prompt = f"Translate: {cleaned_text}"
     
     try:
-        messages = []
-        messages.append(Message(role="system", content=system_prompt))
-        messages.append(Message(role="user", content=prompt))
-
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
 
-        translation_response = await ollamac.chat(
-            messages=messages,
-            stream=False,
-            format=TranslateReseponse.model_json_schema(),
-            timout=settings.OLLAMA_TIMEOUT
-        )
-        contents = translation_response.get("message", {}).get("content", "").strip()
+        # 스트리밍 사용 시 번역이 완성되는 즉시 반환하고 나머지(word_mapping)는 계속 수신 (평가 시에는 전체 응답 필요)
+        stream_task = None
+        if settings.ENABLE_STREAMING and not settings.ENABLE_EVALUATION:
+            contents, translated_text, stream_task = await _stream_translation(messages)
+        else:
+            translation_response = await ollamac.chat(
+                messages=messages,
+                stream=False,
+                format=TranslateReseponse,
+                timeout=settings.OLLAMA_TIMEOUT
+            )
+            contents = translation_response.get("message", {}).get("content", "").strip()
 
-        # JSON 파싱 시도
-        try:
-            response_content = parse_llm_json_response(content=contents)
-            translated_text = response_content.get("translation", "")
-            word_mapping = response_content.get("word_mapping", "")
-            
-            # JSON에서 번역 결과를 얻지 못한 경우 원본 응답 사용
-            if not translated_text:
+        if stream_task is not None:
+            word_mapping = []
+        else:
+            # JSON 파싱 시도
+            try:
+                response_content = parse_llm_json_response(content=contents)
+                translated_text = response_content.get("translation", "")
+                word_mapping = response_content.get("word_mapping", "")
+                
+                # JSON에서 번역 결과를 얻지 못한 경우 원본 응답 사용
+                if not translated_text:
+                    translated_text = response_content
+            except (json.JSONDecodeError, ValueError):
+                # JSON 파싱 실패 시 전체 응답 텍스트 사용
                 translated_text = response_content
-        except (json.JSONDecodeError, ValueError):
-            # JSON 파싱 실패 시 전체 응답 텍스트 사용
-            translated_text = response_content
         
         # 결과가 없는 경우
         if not translated_text:
@@ -235,13 +397,18 @@ async def translate_text(source_lang: str, target_lang: str, text: str, system_p
             len(text) <= settings.MAX_TEXT_LENGTH_FOR_EVALUATION and
             len(translated_text) >= 2):
 
-            translated_text, word_mapping = await translate_evaluator(
-                text=text, 
-                translated_text=translated_text, 
-                source_lang=source_lang, 
-                target_lang=target_lang, 
-                word_mapping=word_mapping
-            )
+            # 원문 그대로이거나 숫자/기호만 있는 텍스트는 LLM 평가 생략
+            if _is_trivially_fine(text, translated_text):
+                quality_score = 100
+                feedback = "번역이 필요 없는 텍스트"
+            else:
+                translated_text, word_mapping = await translate_evaluator(
+                    text=text, 
+                    translated_text=translated_text, 
+                    source_lang=source_lang, 
+                    target_lang=target_lang, 
+                    word_mapping=word_mapping
+                )
 
         # 번역 결과 로깅
         TranslationLogger.log_translation(
@@ -262,22 +429,19 @@ async def translate_text(source_lang: str, target_lang: str, text: str, system_p
         )
 
         # 캐시 저장
-        if settings.ENABLE_CACHE:
-            translation_cache[cache_key] = translated_text
-            
-            # 캐시 크기 제한 (간단한 구현)
-            if len(translation_cache) > 1000:
-                # 캐시의 가장 오래된 항목 10% 제거
-                keys_to_remove = list(translation_cache.keys())[:100]
-                for k in keys_to_remove:
-                    translation_cache.pop(k, None)
+        _cache_translation(cache_key, translated_text)
+        SEMANTIC_CACHE.add(source_lang, target_lang, cleaned_text, translated_text, embedding)
         
-        try:
-            # 번역 매핑에 추가
-            logger.debug(f"사전 매핑 처리: {word_mapping}")
-            DICTIONARY.process_word_mapping(word_mapping, target_lang )
-        except Exception as e:
-            logger.debug(f"사전 매핑 처리 오류: {str(e)}")
+        if stream_task is not None:
+            # 스트리밍 중인 나머지 응답의 word_mapping은 수신이 끝나면 사전에 반영
+            stream_task.add_done_callback(functools.partial(_apply_streamed_word_mapping, target_lang))
+        else:
+            try:
+                # 번역 매핑에 추가
+                logger.debug(f"사전 매핑 처리: {word_mapping}")
+                DICTIONARY.process_word_mapping(word_mapping, target_lang )
+            except Exception as e:
+                logger.debug(f"사전 매핑 처리 오류: {str(e)}")
         
         return translated_text
     
@@ -295,6 +459,101 @@ async def translate_text(source_lang: str, target_lang: str, text: str, system_p
         )
 
 
+async def translate_batch(source_lang: str, target_lang: str, texts: List[str], system_prompt: str) -> Optional[List[str]]:
+    """
+    여러 텍스트를 한 번의 Ollama 요청으로 번역합니다.
+    캐시나 사전에서 찾을 수 있는 텍스트는 미리 제외하고 호출해야 합니다.
+    
+    Args:
+        source_lang: 원본 언어 코드
+        target_lang: 대상 언어 코드
+        texts: 번역할 텍스트 목록
+        system_prompt: 일괄 번역 시스템 프롬프트
+    
+    Returns:
+        Optional[List[str]]: 입력 순서대로 번역된 텍스트 목록, 응답이 올바르지 않으면 None
+    """
+    if not source_lang:
+        source_lang = "auto"
+    
+    # 텍스트 경계가 섞이지 않도록 JSON 배열로 전달
+    cleaned_texts = [clean_special_chars(text, _ALLOWED_SPECIAL_CHARS) for text in texts]
+    prompt = f"Translate: {json.dumps(cleaned_texts, ensure_ascii=False)}"
+    
+    try:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+
+        translation_response = await ollamac.chat(
+            messages=messages,
+            stream=False,
+            format=BatchTranslateReseponse,
+            timeout=settings.OLLAMA_TIMEOUT
+        )
+        contents = translation_response.get("message", {}).get("content", "").strip()
+        response_content = parse_llm_json_response(content=contents)
+    except httpx.RequestError as e:
+        error_detail = f"Ollama 서비스 연결 오류: {str(e)}"
+        TranslationLogger.log_error("connection_error", {
+            "error": str(e),
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "texts": texts
+        })
+        raise HTTPException(
+            status_code=503,
+            detail=error_detail
+        )
+    except (json.JSONDecodeError, ValueError):
+        # JSON 파싱 실패 시 개별 번역으로 처리하도록 None 반환
+        return None
+    
+    translations = response_content.get("translations")
+    
+    # 번역 개수가 맞지 않으면 결과를 신뢰할 수 없으므로 사용하지 않음
+    if (not isinstance(translations, list) or len(translations) != len(texts) or
+            not all(isinstance(t, str) and t.strip() for t in translations)):
+        TranslationLogger.log_error("batch_mismatch", {
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "texts": texts,
+            "response": contents
+        })
+        return None
+    
+    for text, translated_text in zip(texts, translations):
+        # 번역 결과 로깅
+        TranslationLogger.log_translation(
+            source_lang=source_lang, 
+            target_lang=target_lang, 
+            source_text=text, 
+            translated_text=translated_text
+        )
+        
+        # 번역 이력에 추가
+        HISTORY.add_history(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            source_text=text,
+            translated_text=translated_text
+        )
+        
+        # 캐시 저장
+        _cache_translation(f"{source_lang}:{target_lang}:{text}", translated_text)
+    
+    try:
+        # 번역 매핑에 추가
+        word_mapping = response_content.get("word_mapping", [])
+        logger.debug(f"사전 매핑 처리: {word_mapping}")
+        DICTIONARY.process_word_mapping(word_mapping, target_lang)
+    except Exception as e:
+        logger.debug(f"사전 매핑 처리 오류: {str(e)}")
+    
+    return translations
+
+
 async def translate_evaluator(text: str, translated_text:str , source_lang: str, target_lang: str, word_mapping: List[WordMapping]) -> str:
     """
     번역 품질 평가를 위한 텍스트 변환
@@ -321,7 +580,7 @@ async def translate_evaluator(text: str, translated_text:str , source_lang: str,
         
         # 외국어 혼합이 감지되었거나 품질 기준 미달 시 재시도
         if quality_score < settings.QUALITY_THRESHOLD:
-            print(f"번역 품질 점수({quality_score})가 기준({settings.QUALITY_THRESHOLD})에 미달, 재시도합니다.")
+            logger.debug("번역 품질 점수(%s)가 기준(%s)에 미달, 재시도합니다.", quality_score, settings.QUALITY_THRESHOLD)
             
             # 최대 개선 시도 횟수만큼 반복
             attempts = 0
@@ -330,79 +589,100 @@ async def translate_evaluator(text: str, translated_text:str , source_lang: str,
             best_translation = translated_text
             best_feedback = feedback
             
-            while attempts < settings.MAX_IMPROVEMENT_ATTEMPTS:
-                try:
-                    print(f"번역 개선 시도 {attempts+1}/{settings.MAX_IMPROVEMENT_ATTEMPTS}")                                
-                
-                    enhancement_feedback = feedback
-                    
-                    # 번역 개선 시도
-                    improved_translation, word_mapping = await asyncio.wait_for(
-                        EVALUATOR.improve_translation(
-                            source_text=text,
-                            previous_translation=current_translation,
-                            source_lang=source_lang,
-                            target_lang=target_lang,
-                            feedback=enhancement_feedback,
-                            word_mapping=word_mapping
-                        ),
-                        timeout=settings.OLLAMA_TIMEOUT  # 개선에는 더 많은 시간 허용
-                    )
-                    
-                    # 개선된 번역이 이전과 동일하면 더 이상 시도하지 않음
-                    if improved_translation == current_translation:
-                        print("번역 개선 없음, 종료합니다.")
-                        break
+            # 개선된 번역을 다시 평가하는 동안 미리 시작한 다음 개선 시도
+            next_improve_task = None
+            
+            def start_improvement(previous_translation, enhancement_feedback, word_mapping):
+                return asyncio.ensure_future(EVALUATOR.improve_translation(
+                    source_text=text,
+                    previous_translation=previous_translation,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    feedback=enhancement_feedback,
+                    word_mapping=word_mapping
+                ))
+            
+            try:
+                while attempts < settings.MAX_IMPROVEMENT_ATTEMPTS:
+                    try:
+                        logger.debug("번역 개선 시도 %d/%d", attempts + 1, settings.MAX_IMPROVEMENT_ATTEMPTS)
                     
-                    # 개선된 번역 평가
-                    improved_score, improved_feedback = await asyncio.wait_for(
-                        EVALUATOR.evaluate_translation(
+                        # 번역 개선 시도 (개선된 번역의 점수와 피드백도 함께 받음). 미리 시작한 시도가 있으면 그 결과 사용
+                        improve_task = next_improve_task or start_improvement(current_translation, feedback, word_mapping)
+                        next_improve_task = None
+                        improved_translation, word_mapping, improved_score, improved_feedback = await asyncio.wait_for(
+                            improve_task,
+                            timeout=settings.OLLAMA_TIMEOUT  # 개선에는 더 많은 시간 허용
+                        )
+                        
+                        # 개선된 번역이 이전과 동일하면 더 이상 시도하지 않음
+                        if improved_translation == current_translation:
+                            logger.debug("번역 개선 없음, 종료합니다.")
+                            break
+                        
+                        # 점수를 받지 못했거나 별도 검증이 설정된 경우에만 개선된 번역을 다시 평가
+                        if improved_score is None or settings.VERIFY_IMPROVEMENT:
+                            # 평가를 기다리는 동안 다음 개선을 미리 시작 (평가가 기준을 통과하면 취소)
+                            if attempts + 1 < settings.MAX_IMPROVEMENT_ATTEMPTS:
+                                next_improve_task = start_improvement(improved_translation, improved_feedback or feedback, word_mapping)
+                            
+                            improved_score, improved_feedback = await asyncio.wait_for(
+                                EVALUATOR.evaluate_translation(
+                                    source_text=text,
+                                    translated_text=improved_translation,
+                                    source_lang=source_lang,
+                                    target_lang=target_lang
+                                ),
+                                timeout=settings.OLLAMA_TIMEOUT
+                            )
+                        
+                        logger.debug("개선된 번역 품질 점수: %s (이전: %s)", improved_score, best_score)
+                        
+                        # 로그에 평가 결과 기록
+                        TranslationLogger.log_evaluation(
                             source_text=text,
                             translated_text=improved_translation,
-                            source_lang=source_lang,
-                            target_lang=target_lang
-                        ),
-                        timeout=settings.OLLAMA_TIMEOUT
-                    )
-                    
-                    print(f"개선된 번역 품질 점수: {improved_score} (이전: {best_score})")
-                    
-                    # 로그에 평가 결과 기록
-                    TranslationLogger.log_evaluation(
-                        source_text=text,
-                        translated_text=improved_translation,
-                        score=improved_score,
-                        feedback=improved_feedback
-                    )
-                    
-                    # 더 나은 점수면 업데이트
-                    if improved_score > best_score:
-                        best_score = improved_score
-                        best_translation = improved_translation
-                        best_feedback = improved_feedback
-                        print(f"더 나은 번역 발견: 점수 {best_score}")
-                    
-                    # 품질 기준 충족 시 종료
-                    if improved_score >= settings.QUALITY_THRESHOLD:
-                        print(f"품질 기준 충족: {improved_score} >= {settings.QUALITY_THRESHOLD}")
-                        break
+                            score=improved_score,
+                            feedback=improved_feedback
+                        )
+                        
+                        # 더 나은 점수면 업데이트
+                        if improved_score > best_score:
+                            best_score = improved_score
+                            best_translation = improved_translation
+                            best_feedback = improved_feedback
+                            logger.debug("더 나은 번역 발견: 점수 %s", best_score)
+                        
+                        # 품질 기준 충족 시 종료
+                        if improved_score >= settings.QUALITY_THRESHOLD:
+                            logger.debug("품질 기준 충족: %s >= %s", improved_score, settings.QUALITY_THRESHOLD)
+                            break
+                        
+                        # 다음 시도를 위해 현재 번역 업데이트
+                        current_translation = improved_translation
+                        feedback = improved_feedback
+                        
+                    except asyncio.TimeoutError:
+                        logger.warning("번역 개선 시도 %d 시간 초과", attempts + 1)
+                    except Exception as e:
+                        logger.warning("번역 개선 오류: %s", e)
                     
-                    # 다음 시도를 위해 현재 번역 업데이트
-                    current_translation = improved_translation
-                    feedback = improved_feedback
+                    # 이번 시도가 실패했으면 미리 시작한 다음 시도는 기준 번역이 달라지므로 버림
+                    if next_improve_task is not None and current_translation != improved_translation:
+                        next_improve_task.cancel()
+                        next_improve_task = None
                     
-                except asyncio.TimeoutError:
-                    print(f"번역 개선 시도 {attempts+1} 시간 초과")
-                except Exception as e:
-                    print(f"번역 개선 오류: {str(e)}")
-                
-                attempts += 1
+                    attempts += 1
+            finally:
+                # 사용하지 않은 미리 시작한 개선 시도 취소
+                if next_improve_task is not None:
+                    next_improve_task.cancel()
             
             # 최종 결과 사용
             translated_text = best_translation
             quality_score = best_score
             feedback = best_feedback
-            print(f"최종 번역 품질 점수: {quality_score}")
+            logger.debug("최종 번역 품질 점수: %s", quality_score)
             
     except asyncio.TimeoutError:
         # 평가 시간 초과 시 기본값 사용
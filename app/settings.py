@@ -1,30 +1,37 @@
 import os
-import sys
 import logging
-from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import ClassVar, List
 
 # .env 파일 로드
 load_dotenv()
 
+# 환경 변수 스냅샷 (.env 로드 후 한 번만 복사하여 이후 조회에 사용)
+_ENV = dict(os.environ)
+
+def _get(key: str, default: str = "") -> str:
+    """환경 변수 값을 반환합니다. 없으면 default를 반환합니다."""
+    return _ENV.get(key, default)
+
+# 참으로 해석할 환경 변수 값
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+
+def _bool_env(key: str, default: str) -> bool:
+    """환경 변수 값을 bool로 해석합니다."""
+    return _get(key, default).lower() in _TRUE_VALUES
+
 #####################################
 ## logging
 #####################################
 
 BASEPATH = Path(__file__).resolve().parent
 
-GLOBAL_LOG_LEVEL = os.environ.get("GLOBAL_LOG_LEVEL", "").upper()
+GLOBAL_LOG_LEVEL = _get("GLOBAL_LOG_LEVEL", "").upper()
 if GLOBAL_LOG_LEVEL == "":   
     GLOBAL_LOG_LEVEL = "INFO"
 
-# 로깅 설정
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 logger = logging.getLogger(__name__)
 
 log_sources = [
@@ -40,10 +47,10 @@ SRC_LOG_LEVELS = {}
 
 for source in log_sources:
     log_env_var = source + "_LOG_LEVEL"
-    SRC_LOG_LEVELS[source] = os.environ.get(log_env_var, "").upper()
+    SRC_LOG_LEVELS[source] = _get(log_env_var, "").upper()
     if SRC_LOG_LEVELS[source] not in logging.getLevelNamesMapping():
         SRC_LOG_LEVELS[source] = GLOBAL_LOG_LEVEL
-    logger.info(f"{log_env_var}: {SRC_LOG_LEVELS[source]}")
+    logger.debug(f"{log_env_var}: {SRC_LOG_LEVELS[source]}")  # 요약은 start_logger()에서 출력
 
 logger.setLevel(SRC_LOG_LEVELS["CONFIG"])
 
@@ -52,46 +59,30 @@ logger.setLevel(SRC_LOG_LEVELS["CONFIG"])
 #####################################
 
 # 리소스 경로
-RESOURCES_PATH = Path( BASEPATH.parent / os.getenv("RESOURCES_PATH", "resources") ).resolve()  # 리소스 파일 경로
-_DICTIONARIES_PATH = RESOURCES_PATH / Path( "dictionaries" ) # 번역 파일 경로
+# 경로는 시작 시 한 번만 resolve하고, 다른 모듈에서는 미리 변환한 문자열을 사용
+RESOURCES_PATH = ( BASEPATH.parent / _get("RESOURCES_PATH", "resources") ).resolve()  # 리소스 파일 경로
+_DICTIONARIES_PATH = RESOURCES_PATH / "dictionaries" # 번역 파일 경로
 
-DICTIONARIES_PATH: str = str( _DICTIONARIES_PATH )
-HISTORY_FILE: str = str( Path( RESOURCES_PATH / "translation_history.json" ).resolve() ) # 번역 이력 파일 경로 )
+DICTIONARIES_PATH: str = os.fspath( _DICTIONARIES_PATH )
+HISTORY_FILE: str = os.fspath( RESOURCES_PATH / "translation_history.jsonl" ) # 번역 이력 파일 경로 (JSONL, 추가 전용)
 
 logger.debug(f"리소스 경로: {RESOURCES_PATH}")
 logger.debug(f"사전 경로: {_DICTIONARIES_PATH}")
 
 # 로그 경로
-LOG_PATH = os.environ.get("LOG_PATH", "logs").upper()
-LOG_FILE: str= str(  Path( Path(LOG_PATH) / "translation.log" ).resolve() ) # 번역 이력 파일 경로
+LOG_PATH = _get("LOG_PATH", "logs")
+_LOG_PATH = Path(LOG_PATH)
+LOG_FILE: str = os.fspath( ( _LOG_PATH / "translation.log" ).resolve() ) # 번역 이력 파일 경로
 
 # 폴더 생성
-PATHS : List[Path] = [ Path(LOG_PATH), _DICTIONARIES_PATH ]
+PATHS : List[Path] = [ _LOG_PATH, _DICTIONARIES_PATH ]
 
 try:
     for path in PATHS:
-        path.exists() or os.makedirs(path, exist_ok=True )  # 디렉토리 생성
+        os.makedirs(path, exist_ok=True)  # 디렉토리 생성 (이미 있으면 무시)
 except Exception as e:
     raise RuntimeError(f"폴더 생성 실패: {e}") from e
 
-# 파일 로깅을 위한 설정 (UTF-8 인코딩 적용)
-class UTF8FileHandler(logging.FileHandler):
-    """UTF-8 인코딩을 사용하는 파일 핸들러"""
-    def __init__(self, filename, mode='a', encoding='utf-8', delay=False):
-        logging.FileHandler.__init__(self, filename, mode, encoding, delay)
-
-# # TimedRotatingFileHandler 추가
-# log_file_path = os.path.join(LOG_PATH, "translation.log")
-# file_handler = TimedRotatingFileHandler(
-#     log_file_path,
-#     when='midnight',  # 매일 자정에 로테이션
-#     interval=1,       # 1일마다
-#     backupCount=30,   # 30일분 보관
-#     encoding='utf-8'
-# )
-# file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-# logger.addHandler(file_handler)
-
 #####################################
 ## Settings
 #####################################
@@ -99,39 +90,62 @@ class UTF8FileHandler(logging.FileHandler):
 class Settings(BaseSettings):
     # 애플리케이션 설정
     APP_NAME: str = "Translation Service API"
+
+    # CORS 설정 (브라우저에서 API를 호출하는 경우에만 필요)
+    ENABLE_CORS: bool = _bool_env("ENABLE_CORS", "False")
+    # 쉼표로 구분된 값을 직접 분리하므로 ClassVar로 선언 (pydantic이 JSON으로 다시 해석하지 않도록 함)
+    CORS_ALLOW_ORIGINS: ClassVar[list] = [origin.strip() for origin in _get("CORS_ALLOW_ORIGINS", "").split(",") if origin.strip()]
     
     # Ollama 설정
-    OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-    OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "huihui_ai/kanana-nano-abliterated")
-    OLLAMA_TIMEOUT: int = int(os.getenv("OLLAMA_TIMEOUT", "300"))  # 초 단위 (기본값: 300초)
-    OLLAMA_SERVER_CHECK_ENABLE: bool = os.getenv("OLLAMA_SERVER_CHECK_ENABLE", "False").lower() in ["true", "1", "yes"]
-    OLLAMA_HEALTH_CHECK_ENABLE: bool = os.getenv("OLLAMA_HEALTH_CHECK_ENABLE", "False").lower() in ["true", "1", "yes"]
+    OLLAMA_BASE_URL: str = _get("OLLAMA_BASE_URL", "http://localhost:11434")
+    OLLAMA_MODEL: str = _get("OLLAMA_MODEL", "huihui_ai/kanana-nano-abliterated")
+    OLLAMA_TIMEOUT: int = int(_get("OLLAMA_TIMEOUT", "300"))  # 초 단위 (기본값: 300초)
+    OLLAMA_SERVER_CHECK_ENABLE: bool = _bool_env("OLLAMA_SERVER_CHECK_ENABLE", "False")
+    OLLAMA_HEALTH_CHECK_ENABLE: bool = _bool_env("OLLAMA_HEALTH_CHECK_ENABLE", "False")
+    OLLAMA_KEEP_ALIVE: str = _get("OLLAMA_KEEP_ALIVE", "-1")  # 모델 메모리 유지 시간 (-1: 무기한, 예: "24h")
+    OLLAMA_PING_INTERVAL: int = int(_get("OLLAMA_PING_INTERVAL", "600"))  # 상태확인 핑 간격 (초)
+    OLLAMA_MAX_CONNECTIONS: int = int(_get("OLLAMA_MAX_CONNECTIONS", "128"))  # Ollama 최대 동시 연결 수
+    OLLAMA_MAX_KEEPALIVE_CONNECTIONS: int = int(_get("OLLAMA_MAX_KEEPALIVE_CONNECTIONS", "64"))  # 재사용을 위해 유지할 연결 수
+    OLLAMA_MAX_CONCURRENCY: int = int(_get("OLLAMA_MAX_CONCURRENCY", "4"))  # 동시에 처리할 최대 LLM 요청 수 (0: 제한 없음)
     
     
     # 성능 최적화 설정
-    PRELOAD_MODEL: bool = os.getenv("PRELOAD_MODEL", "True").lower() in ["true", "1", "yes"]
+    PRELOAD_MODEL: bool = _bool_env("PRELOAD_MODEL", "True")
+    ENABLE_BATCHING: bool = _bool_env("ENABLE_BATCHING", "False")
+    BATCH_MAX_SIZE: int = int(_get("BATCH_MAX_SIZE", "4"))  # 한 번에 전송할 최대 요청 수
+    BATCH_MAX_WAIT_MS: int = int(_get("BATCH_MAX_WAIT_MS", "10"))  # 배치 대기 시간 (밀리초)
+    ENABLE_STREAMING: bool = _bool_env("ENABLE_STREAMING", "False")  # 번역 필드가 완성되는 즉시 응답 (평가 비활성화 시에만)
     
     # 지원하는 언어 코드 목록
     # SUPPORTED_LANGUAGES: list = ["en", "ko", "ja", "zh", "es", "fr", "de", "ru", "pt", "ar"]
-    SUPPORTED_LANGUAGES: list = os.getenv("SUPPORTED_LANGUAGES", "en,ko").split(",")
+    # 요청마다 멤버십 검사에 사용하므로 frozenset으로 저장 (공백 허용, 예: "en, ko")
+    # ClassVar로 선언하여 pydantic이 환경 변수를 JSON으로 다시 해석하지 않도록 함
+    SUPPORTED_LANGUAGES: ClassVar[frozenset] = frozenset(
+        lang.strip().lower() for lang in _get("SUPPORTED_LANGUAGES", "en,ko").split(",") if lang.strip()
+    )
     
     # 캐싱 설정
-    ENABLE_CACHE: bool = os.getenv("ENABLE_CACHE", "True").lower() in ["true", "1", "yes"]
-    CACHE_EXPIRATION: int = int(os.getenv("CACHE_EXPIRATION", "3600"))  # 초 단위 (1시간)
+    ENABLE_CACHE: bool = _bool_env("ENABLE_CACHE", "True")
+    CACHE_EXPIRATION: int = int(_get("CACHE_EXPIRATION", "3600"))  # 초 단위 (1시간)
+    ENABLE_SEMANTIC_CACHE: bool = _bool_env("ENABLE_SEMANTIC_CACHE", "False")
+    SEMANTIC_CACHE_MODEL: str = _get("SEMANTIC_CACHE_MODEL", "nomic-embed-text")  # 임베딩용 Ollama 모델
+    SEMANTIC_CACHE_THRESHOLD: float = float(_get("SEMANTIC_CACHE_THRESHOLD", "0.95"))  # 재사용할 최소 코사인 유사도
+    SEMANTIC_CACHE_SIZE: int = int(_get("SEMANTIC_CACHE_SIZE", "1000"))  # 언어 쌍별 최대 보관 항목 수
 
     # 사전 번역 설정
-    ENABLE_DICTIONARY: bool = os.getenv("ENABLE_DICTIONARY", "True").lower() in ["true", "1", "yes"]
+    ENABLE_DICTIONARY: bool = _bool_env("ENABLE_DICTIONARY", "True")
     
     # 번역 품질 평가 설정 (.env 파일에서 조정 가능)
-    ENABLE_EVALUATION: bool = os.getenv("ENABLE_EVALUATION", "False").lower() in ["true", "1", "yes"]
-    QUALITY_THRESHOLD: int = int(os.getenv("QUALITY_THRESHOLD", "90"))  # 품질 점수 기준치 (0-100)
-    MAX_IMPROVEMENT_ATTEMPTS: int = int(os.getenv("MAX_IMPROVEMENT_ATTEMPTS", "3"))  # 최대 개선 시도 횟수
+    ENABLE_EVALUATION: bool = _bool_env("ENABLE_EVALUATION", "False")
+    QUALITY_THRESHOLD: int = int(_get("QUALITY_THRESHOLD", "90"))  # 품질 점수 기준치 (0-100)
+    MAX_IMPROVEMENT_ATTEMPTS: int = int(_get("MAX_IMPROVEMENT_ATTEMPTS", "3"))  # 최대 개선 시도 횟수
+    VERIFY_IMPROVEMENT: bool = _bool_env("VERIFY_IMPROVEMENT", "False")  # 개선된 번역을 별도 평가 요청으로 다시 검증할지 여부
     
     # 평가 제외 조건 (.env 파일에서 조정 가능)
-    MIN_TEXT_LENGTH_FOR_EVALUATION: int = int(os.getenv("MIN_TEXT_LENGTH_FOR_EVALUATION", "8"))  # 평가에 필요한 최소 텍스트 길이
-    MAX_TEXT_LENGTH_FOR_EVALUATION: int = int(os.getenv("MAX_TEXT_LENGTH_FOR_EVALUATION", "1000"))  # 평가에 필요한 최대 텍스트 길이
+    MIN_TEXT_LENGTH_FOR_EVALUATION: int = int(_get("MIN_TEXT_LENGTH_FOR_EVALUATION", "8"))  # 평가에 필요한 최소 텍스트 길이
+    MAX_TEXT_LENGTH_FOR_EVALUATION: int = int(_get("MAX_TEXT_LENGTH_FOR_EVALUATION", "1000"))  # 평가에 필요한 최대 텍스트 길이
     
     # 이력 관리 설정
-    MAX_HISTORY_PER_LANG_PAIR: int = int(os.getenv("MAX_HISTORY_PER_LANG_PAIR", "10"))  # 언어 쌍별 최대 이력 수
+    MAX_HISTORY_PER_LANG_PAIR: int = int(_get("MAX_HISTORY_PER_LANG_PAIR", "10"))  # 언어 쌍별 최대 이력 수
     
 settings = Settings()
\ No newline at end of file
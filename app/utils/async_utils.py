@@ -0,0 +1,35 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """기다리는 호출자가 모두 취소된 경우에도 예외 미확인 경고가 나지 않도록 예외를 확인합니다."""
+    if not task.cancelled():
+        task.exception()
+
+async def run_once(in_flight: Dict[Hashable, asyncio.Task], key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고 그 결과를 기다립니다. (요청 병합)
+
+    작업은 별도 Task로 실행되므로 한 호출자가 취소되어도 같은 작업을 기다리는 다른 호출자에게는 영향이 없습니다.
+
+    Args:
+        in_flight: 실행 중인 작업을 보관하는 딕셔너리 (키: 작업 키, 값: Task)
+        key: 작업을 구분하는 키
+        factory: 작업 코루틴을 생성하는 함수
+
+    Returns:
+        Any: 작업 결과
+    """
+    task = in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        in_flight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if in_flight.get(key) is t:
+                del in_flight[key]
+            _retrieve_exception(t)
+
+        task.add_done_callback(_done)
+
+    return await asyncio.shield(task)
@@ -18,7 +18,8 @@ from app.settings import (
     # AUDIT_LOG_LEVEL,
     # AUDIT_LOGS_FILE_PATH,
     GLOBAL_LOG_LEVEL,
-    LOG_FILE
+    LOG_FILE,
+    SRC_LOG_LEVELS
 )
 
 
@@ -35,7 +36,14 @@ def stdout_format(record: "Record") -> str:
     Returns:
     str: A formatted log string intended for stdout.
     """
-    record["extra"]["extra_json"] = json.dumps(record["extra"])
+    extra = record["extra"]
+    # 대부분의 로그에는 extra가 없으므로 직렬화 생략 (다른 sink에서 추가한 extra_json 키는 제외)
+    if extra.keys() <= {"extra_json"}:
+        extra["extra_json"] = "{}"
+    else:
+        extra["extra_json"] = json.dumps(
+            {k: v for k, v in extra.items() if k != "extra_json"}, default=str
+        )
     return (
         "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
         "<level>{level: <8}</level> | "
@@ -45,6 +53,14 @@ def stdout_format(record: "Record") -> str:
     )
 
 
+# emit에서 매번 조회하지 않도록 미리 저장
+_LOGGING_FILE = logging.__file__
+_getframe = sys._getframe
+
+# 표준 logging 레벨 이름 -> Loguru 레벨 (없는 레벨은 숫자 레벨 사용)
+_LEVEL_CACHE = {}
+
+
 class InterceptHandler(logging.Handler):
     """
     Intercepts log records from Python's standard logging module
@@ -57,13 +73,16 @@ class InterceptHandler(logging.Handler):
         It transforms the standard `LogRecord` into a format compatible with Loguru
         and passes it to Loguru's logger.
         """
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        frame, depth = sys._getframe(6), 6
-        while frame and frame.f_code.co_filename == logging.__file__:
+        level = _LEVEL_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            _LEVEL_CACHE[record.levelname] = level
+
+        frame, depth = _getframe(6), 6
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -118,4 +137,5 @@ def start_logger():
         uvicorn_logger.handlers = [InterceptHandler()]
 
     logger.info(f"GLOBAL_LOG_LEVEL: {GLOBAL_LOG_LEVEL}")
+    logger.info(f"SRC_LOG_LEVELS: {SRC_LOG_LEVELS}")
     logger.info(f"로그 파일 핸들러 초기화 완료: logs/app.log")
\ No newline at end of file
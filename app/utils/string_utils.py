@@ -1,7 +1,75 @@
-from typing import Any
-import json
+from functools import lru_cache
+from typing import Any, Optional, Pattern, Tuple
 import re
-import ast
+
+import orjson
+
+# 마크다운 코드 블럭 구분자
+_MD_FENCE = '```'
+# 중괄호로 시작하는 JSON 텍스트
+_JSON_RE = re.compile(r'(\{[\s\S]*\})')
+# 이중 이스케이프된 응답에서 나타나는 문자열 (모두 백슬래시를 포함)
+_ESC_MARKERS = ('\\n', '\\"', '\\\\')
+
+# 연속된 공백
+_WS_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=None)
+def _special_char_filters(allowed: str) -> Tuple[dict, Pattern]:
+    """
+    허용할 특수문자 조합별로 특수문자를 공백으로 치환하는 변환 테이블(ASCII용)과 정규식을 한 번만 만듭니다.
+    ASCII 텍스트는 정규식보다 빠른 str.translate를 사용합니다.
+    """
+    table = str.maketrans({
+        c: ' ' for c in map(chr, range(128))
+        if not (c.isalnum() or c == '_' or c.isspace() or c in allowed)
+    })
+    return table, re.compile(r'[^\w\s' + re.escape(allowed) + ']')
+
+def clean_special_chars(text: str, allowed: str) -> str:
+    """
+    LLM에 전달하기 전에 허용된 특수문자와 일반 문자(알파벳, 숫자, 공백)만 남기고 연속된 공백을 정리합니다.
+    
+    Args:
+        text: 처리할 텍스트
+        allowed: 보존할 특수문자
+        
+    Returns:
+        str: 처리된 텍스트
+    """
+    if not text:
+        return ""
+    
+    table, special_re = _special_char_filters(allowed)
+    cleaned_text = text.translate(table) if text.isascii() else special_re.sub(' ', text)
+    
+    # 연속된 공백을 하나로 치환
+    return _WS_RE.sub(' ', cleaned_text).strip()
+
+def _unescape(content: str) -> str:
+    """
+    문자열에 포함된 이스케이프 문자(\\n, \\", \\\\ 등)를 해석합니다.
+    latin-1 범위 밖의 문자(한글 등)는 \\uXXXX로 바꿨다가 다시 복원되므로 그대로 유지됩니다.
+    """
+    return content.encode('latin-1', 'backslashreplace').decode('unicode_escape')
+
+def _extract_markdown_block(content: str) -> Optional[str]:
+    """
+    첫 번째 마크다운 ```json ``` 블럭의 내용을 반환합니다. 블럭이 없으면 None을 반환합니다.
+    닫는 구분자가 없는 입력에서 정규식이 역추적하지 않도록 str.find로 찾습니다.
+    """
+    start = content.find(_MD_FENCE)
+    if start < 0:
+        return None
+
+    after = start + len(_MD_FENCE)
+    if content.startswith('json', after):
+        after += len('json')
+
+    end = content.find(_MD_FENCE, after)
+    if end < 0:
+        return None
+    return content[after:end]
 
 def parse_llm_json_response(content: Any) -> dict:
     if not isinstance(content, str):
@@ -9,33 +77,39 @@ def parse_llm_json_response(content: Any) -> dict:
             return content
         return {"error": "입력이 문자열이 아닙니다."}
     
-    if not content.strip():
+    stripped = content.strip()
+    if not stripped:
         return {"error": "빈 응답입니다."}
 
+    # 0. 응답 전체가 JSON 객체인 경우 (형식 지정 요청의 일반적인 경우) 바로 파싱
+    if stripped.startswith('{') and stripped.endswith('}'):
+        try:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            pass
+
     # 1. 마크다운 ```json ``` 블럭 추출
-    md_json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    md_match = re.search(md_json_pattern, content)
-    if md_match:
-        content = md_match.group(1).strip()
+    md_block = _extract_markdown_block(content)
+    if md_block is not None:
+        content = md_block.strip()
 
     # 2. 중괄호로 시작하는 JSON 텍스트 추출 (이스케이프 포함 가능)
-    json_pattern = r'(\{[\s\S]*\})'
-    json_match = re.search(json_pattern, content)
+    json_match = _JSON_RE.search(content)
     if json_match:
         content = json_match.group(1).strip()
 
     # 3. 이스케이프 문자열 처리 우선 시도 (ex: \n, \", \t 등)
-    if '\\n' in content or '\\"' in content or '\\\\' in content:
+    # 백슬래시가 없으면 한 번의 검사로 건너뜀
+    if '\\' in content and any(marker in content for marker in _ESC_MARKERS):
         try:
-            evaluated = ast.literal_eval(f'"""{content}"""')
-            return json.loads(evaluated)
-        except (SyntaxError, ValueError, json.JSONDecodeError) as e:
+            return orjson.loads(_unescape(content))
+        except (UnicodeDecodeError, orjson.JSONDecodeError):
             pass
 
     # 4. 일반 JSON 파싱 시도
     try:
-        return json.loads(content)
-    except json.JSONDecodeError as e:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as e:
         return {
             "error": f"JSON 파싱 실패: {str(e)}",
             "original_content": content
@@ -7,19 +7,28 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Run the FastAPI application with Uvicorn')
     
     # Uvicorn 설정 인자 추가
-    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes (default: 1)')
+    # uvloop은 Windows를 지원하지 않으므로 기본 asyncio 루프 사용
+    default_loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    
+    # 워커마다 사전/이력 파일을 따로 다시 작성하고 Ollama 동시 요청 제한도 따로 가지므로 기본값은 1
+    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes (default: 1, see README before increasing)')
     parser.add_argument('--host', type=str, default='0.0.0.0', help='Host to bind to (default: 0.0.0.0)')
     parser.add_argument('--port', type=int, default=8000, help='Port to bind to (default: 8000)')
     parser.add_argument('--reload', action='store_true', help='Enable auto-reload (development mode)')
     parser.add_argument('--log-level', type=str, default='info', 
                         choices=['critical', 'error', 'warning', 'info', 'debug', 'trace'],
                         help='Log level (default: info)')
+    parser.add_argument('--loop', type=str, default=default_loop, choices=['auto', 'asyncio', 'uvloop'],
+                        help=f'Event loop implementation (default: {default_loop})')
+    parser.add_argument('--backlog', type=int, default=2048, help='Maximum number of pending connections (default: 2048)')
+    parser.add_argument('--limit-concurrency', type=int, default=None,
+                        help='Maximum concurrent connections per worker before returning 503 (default: unlimited)')
     
     # 인자 파싱
     args = parser.parse_args()
     
     print(f"Starting server with {args.workers} worker(s) on {args.host}:{args.port}")
-    print(f"Log level: {args.log_level}, Reload: {'enabled' if args.reload else 'disabled'}")
+    print(f"Log level: {args.log_level}, Reload: {'enabled' if args.reload else 'disabled'}, Loop: {args.loop}")
     
     # Uvicorn 실행
     uvicorn.run(
@@ -28,5 +37,9 @@ if __name__ == "__main__":
         port=args.port, 
         workers=args.workers,
         reload=args.reload,
-        log_level=args.log_level
+        log_level=args.log_level,
+        loop=args.loop,
+        http="httptools",
+        backlog=args.backlog,
+        limit_concurrency=args.limit_concurrency
     )
\ No newline at end of file